@@ -26,11 +26,18 @@ CREATE INDEX ON :Project(name);
 CREATE INDEX ON :Project(created_at);
 
 // Feature indexes
+// (Memgraph uniqueness constraints do not create an index, so index id too)
+CREATE INDEX ON :Feature(id);
 CREATE INDEX ON :Feature(status);
 CREATE INDEX ON :Feature(category);
 CREATE INDEX ON :Feature(priority);
 CREATE INDEX ON :Feature(created_at);
 
+// Step indexes
+CREATE INDEX ON :Step(id);
+CREATE INDEX ON :Step(feature_id);
+CREATE INDEX ON :Step(status);
+
 // Event indexes
 CREATE INDEX ON :Event(event_type);
 CREATE INDEX ON :Event(tool_name);
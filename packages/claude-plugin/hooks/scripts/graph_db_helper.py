@@ -2008,6 +2008,132 @@ def insert_transcript_entry(
     return entry_id
 
 
+def insert_transcript_entries_batch(session_id: str, entries: list[dict]) -> list[str]:
+    """
+    Insert many TranscriptEntry nodes in a few round-trips.
+
+    Equivalent to calling insert_transcript_entry for each entry, but entries,
+    their tool uses and their REPLY_TO links are each written with one UNWIND
+    query, and the session aggregates are updated once.
+
+    Args:
+        session_id: The transcript session ID
+        entries: Dicts of insert_transcript_entry keyword arguments
+                 (entry_type and timestamp required)
+
+    Returns:
+        The entry IDs, in input order
+    """
+    if not entries:
+        return []
+
+    rows = []
+    tool_rows = []
+    reply_rows = []
+    totals = {"inputTokens": 0, "outputTokens": 0, "cacheCreationTokens": 0, "cacheReadTokens": 0}
+
+    for entry in entries:
+        uuid = entry.get("uuid")
+        entry_id = uuid or str(__import__("uuid").uuid4())
+        content = entry.get("content")
+        tool_calls = entry.get("tool_calls") or []
+        row = {
+            "entryId": entry_id,
+            "entryType": entry["entry_type"],
+            "timestamp": entry["timestamp"],
+            "uuid": uuid,
+            "parentUuid": entry.get("parent_uuid"),
+            "content": (content[:10000] if content else None),  # Truncate long content
+            "model": entry.get("model"),
+            "inputTokens": entry.get("input_tokens", 0),
+            "outputTokens": entry.get("output_tokens", 0),
+            "cacheCreationTokens": entry.get("cache_creation_tokens", 0),
+            "cacheReadTokens": entry.get("cache_read_tokens", 0),
+            "stopReason": entry.get("stop_reason"),
+            "isSidechain": entry.get("is_sidechain", False),
+            "toolCallCount": len(tool_calls),
+        }
+        rows.append(row)
+        for key in totals:
+            totals[key] += row[key]
+
+        for tc in tool_calls:
+            tool_input = tc.get("input", {})
+            # Serialize input, truncate if too large
+            input_json = json.dumps(tool_input)
+            if len(input_json) > 5000:
+                input_json = json.dumps({"truncated": True, "preview": str(tool_input)[:500]})
+            tool_rows.append({
+                "entryId": entry_id,
+                "useId": tc.get("id", "") or str(__import__("uuid").uuid4()),
+                "toolName": tc.get("name", ""),
+                "toolInput": input_json,
+            })
+
+        if row["parentUuid"]:
+            reply_rows.append({"entryId": entry_id, "parentUuid": row["parentUuid"]})
+
+    run_write_query(
+        """
+        MATCH (ts:TranscriptSession {id: $sessionId})
+        UNWIND $rows AS row
+        CREATE (e:TranscriptEntry {
+            id: row.entryId,
+            entry_type: row.entryType,
+            timestamp: datetime(row.timestamp),
+            uuid: row.uuid,
+            parent_uuid: row.parentUuid,
+            content: row.content,
+            model: row.model,
+            input_tokens: row.inputTokens,
+            output_tokens: row.outputTokens,
+            cache_creation_tokens: row.cacheCreationTokens,
+            cache_read_tokens: row.cacheReadTokens,
+            stop_reason: row.stopReason,
+            is_sidechain: row.isSidechain,
+            tool_call_count: row.toolCallCount
+        })-[:IN_TRANSCRIPT]->(ts)
+        WITH ts, count(e) AS created
+
+        // Update aggregates on TranscriptSession
+        SET ts.entry_count = ts.entry_count + created,
+            ts.total_input_tokens = ts.total_input_tokens + $inputTokens,
+            ts.total_output_tokens = ts.total_output_tokens + $outputTokens,
+            ts.total_cache_creation_tokens = ts.total_cache_creation_tokens + $cacheCreationTokens,
+            ts.total_cache_read_tokens = ts.total_cache_read_tokens + $cacheReadTokens
+        """,
+        {"sessionId": session_id, "rows": rows, **totals}
+    )
+
+    if tool_rows:
+        run_write_query(
+            """
+            UNWIND $rows AS row
+            MATCH (e:TranscriptEntry {id: row.entryId})
+            CREATE (t:TranscriptToolUse {
+                id: row.useId,
+                tool_name: row.toolName,
+                tool_input: row.toolInput
+            })-[:TOOL_IN_ENTRY]->(e)
+            """,
+            {"rows": tool_rows}
+        )
+
+    # Link to parent entries (conversation threading), after all entries exist
+    if reply_rows:
+        run_write_query(
+            """
+            UNWIND $rows AS row
+            MATCH (e:TranscriptEntry {id: row.entryId})
+            MATCH (parent:TranscriptEntry {uuid: row.parentUuid})
+            MERGE (e)-[:REPLY_TO]->(parent)
+            """,
+            {"rows": reply_rows}
+        )
+
+    return [row["entryId"] for row in rows]
+
+
 def insert_transcript_tool_use(
     entry_id: str,
     tool_id: str,
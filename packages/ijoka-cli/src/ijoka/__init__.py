@@ -12,8 +12,15 @@ Usage:
     features = client.list_features()
 """
 
+from .async_db import AsyncIjokaClient, get_async_client
 from .db import IjokaClient, get_client
 from .models import (
+    FEATURE_CATEGORY_BY_VALUE,
+    FEATURE_STATUS_BY_VALUE,
+    INSIGHT_TYPE_BY_VALUE,
+    SESSION_STATUS_BY_VALUE,
+    STEP_STATUS_BY_VALUE,
+    WORK_ITEM_TYPE_BY_VALUE,
     Feature,
     FeatureCategory,
     FeatureListItem,
@@ -33,6 +40,8 @@ __all__ = [
     # Client
     "IjokaClient",
     "get_client",
+    "AsyncIjokaClient",
+    "get_async_client",
     # Models
     "Feature",
     "FeatureCategory",
@@ -46,4 +55,11 @@ __all__ = [
     "SessionStatus",
     "Step",
     "StepStatus",
+    # Enum value lookups
+    "FEATURE_CATEGORY_BY_VALUE",
+    "FEATURE_STATUS_BY_VALUE",
+    "INSIGHT_TYPE_BY_VALUE",
+    "SESSION_STATUS_BY_VALUE",
+    "STEP_STATUS_BY_VALUE",
+    "WORK_ITEM_TYPE_BY_VALUE",
 ]
@@ -2,6 +2,7 @@
 Ijoka Analytics Module - Pattern Detection, Temporal Analysis, and Agent Profiling.
 """
 
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Optional
 import uuid
@@ -12,7 +13,7 @@ from loguru import logger
 from .models import (
     FeatureCluster, WorkflowPattern, Bottleneck, BottleneckSeverity,
     FeatureCategory, VelocityMetrics, VelocityTrend, AgentProfile,
-    AnalyticsInsight, AnalyticsInsightType,
+    AnalyticsInsight, AnalyticsInsightType, FEATURE_CATEGORY_BY_VALUE,
 )
 
 
@@ -325,10 +326,9 @@ class AgentProfiler:
             # Convert categories to enum values
             preferred_categories = []
             for cat in list(categories)[:5]:  # Top 5
-                try:
-                    preferred_categories.append(FeatureCategory(cat))
-                except ValueError:
-                    pass
+                member = FEATURE_CATEGORY_BY_VALUE.get(cat)
+                if member is not None:
+                    preferred_categories.append(member)
 
             return AgentProfile(
                 agent_id=agent_id,
@@ -549,17 +549,17 @@ class InsightSynthesizer:
         }
 
         try:
-            summary["clusters"] = [c.model_dump() for c in self.pattern_detector.detect_feature_clusters()]
+            summary["clusters"] = [asdict(c) for c in self.pattern_detector.detect_feature_clusters()]
         except Exception as e:
             logger.warning(f"Failed to get clusters: {e}")
 
         try:
-            summary["bottlenecks"] = [b.model_dump() for b in self.pattern_detector.detect_bottlenecks()]
+            summary["bottlenecks"] = [asdict(b) for b in self.pattern_detector.detect_bottlenecks()]
         except Exception as e:
             logger.warning(f"Failed to get bottlenecks: {e}")
 
         try:
-            summary["velocity"] = self.temporal_analyzer.compute_velocity().model_dump()
+            summary["velocity"] = asdict(self.temporal_analyzer.compute_velocity())
         except Exception as e:
             logger.warning(f"Failed to get velocity: {e}")
 
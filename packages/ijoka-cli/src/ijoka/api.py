@@ -204,6 +204,8 @@ class CheckpointResponse(BaseModel):
 
 # Global client - initialized on startup
 _client: Optional[IjokaClient] = None
+# Query engine for the global client, so its response cache outlives a request
+_query_engine: Optional[AgenticQueryEngine] = None
 
 
 def get_client() -> IjokaClient:
@@ -213,16 +215,26 @@ def get_client() -> IjokaClient:
     return _client
 
 
+def get_query_engine() -> AgenticQueryEngine:
+    """Get the query engine for the global client."""
+    global _query_engine
+    client = get_client()
+    if _query_engine is None or _query_engine.client is not client:
+        _query_engine = AgenticQueryEngine(client)
+    return _query_engine
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage app lifecycle - connect/disconnect from database."""
-    global _client
+    global _client, _query_engine
     _client = IjokaClient()
     _client.ensure_project()
     yield
     if _client:
         _client.close()
         _client = None
+        _query_engine = None
 
 
 app = FastAPI(
@@ -940,10 +952,7 @@ async def list_agents():
 @app.post("/analytics/query", response_model=AnalyticsQueryResponse, tags=["Analytics"])
 async def query_analytics(request: AnalyticsQueryRequest):
     """Execute a natural language analytics query."""
-    client = get_client()
-    engine = AgenticQueryEngine(client)
-
-    return engine.query(request.question)
+    return get_query_engine().query(request.question)
 
 
 @app.get("/analytics/digest", response_model=DailyDigestResponse, tags=["Analytics"])
@@ -0,0 +1,922 @@
+"""
+Async graph database client for Ijoka.
+
+Mirrors the core IjokaClient operations on top of neo4j's AsyncGraphDatabase
+so long-lived services can interleave many feature operations on one event
+loop. Scripts and the CLI should keep using the synchronous IjokaClient.
+"""
+
+import asyncio
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncGenerator, Optional
+
+from loguru import logger
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncSession
+
+from .db import (
+    _CYPHER_ARCHIVE_FEATURE,
+    _CYPHER_BLOCK_FEATURE,
+    _CYPHER_CHECKPOINT_STEP,
+    _CYPHER_CLEAR_PRIMARY,
+    _CYPHER_COMPLETE_FEATURE,
+    _CYPHER_CREATE_CHILD_OF,
+    _CYPHER_CREATE_FEATURE,
+    _CYPHER_CREATE_STEPS,
+    _CYPHER_DELETE_STEPS,
+    _CYPHER_DISCOVER_FEATURE,
+    _CYPHER_ENSURE_PROJECT,
+    _CYPHER_GET_ACTIVE_FEATURES,
+    _CYPHER_GET_ACTIVE_SESSION,
+    _CYPHER_GET_ACTIVE_STEP,
+    _CYPHER_GET_ANCESTORS,
+    _CYPHER_GET_CHILDREN,
+    _CYPHER_GET_DESCENDANT_EVENTS,
+    _CYPHER_GET_DESCENDANTS,
+    _CYPHER_GET_FEATURE,
+    _CYPHER_GET_HIERARCHY,
+    _CYPHER_GET_NEXT_FEATURE,
+    _CYPHER_GET_PLAN,
+    _CYPHER_GET_PLAN_PROGRESS,
+    _CYPHER_GET_PRIMARY_FEATURE,
+    _CYPHER_GET_PROJECT,
+    _CYPHER_GET_STATS,
+    _CYPHER_GET_TOP_ACTIVE_FEATURE,
+    _CYPHER_LINK_TO_PARENT,
+    _CYPHER_LIST_FEATURES,
+    _CYPHER_LIST_INSIGHTS,
+    _CYPHER_RECORD_INSIGHT,
+    _CYPHER_SET_PRIMARY,
+    _CYPHER_START_FEATURE,
+    _CYPHER_START_NEXT_FEATURE,
+    _CYPHER_UNLINK_FROM_PARENT,
+    _CYPHER_UPDATE_FEATURE,
+    _CYPHER_UPDATE_STEP_STATUS,
+    GraphDBConfig,
+    IjokaClient,
+    _drift_warning,
+    _plan_progress,
+    _project_stats,
+)
+from .models import (
+    Feature,
+    FeatureListItem,
+    Insight,
+    Project,
+    ProjectStats,
+    Session,
+    Step,
+)
+
+
+class AsyncIjokaClient:
+    """
+    Async client for interacting with Ijoka's graph database.
+
+    Usage:
+        async with AsyncIjokaClient() as client:
+            features = await client.list_features(status="pending")
+    """
+
+    # Decoding is shared with the sync client
+    _detect_project_path = IjokaClient._detect_project_path
+    _node_to_feature = IjokaClient._node_to_feature
+    _record_to_feature = IjokaClient._record_to_feature
+    _record_to_list_item = IjokaClient._record_to_list_item
+    _node_to_project = IjokaClient._node_to_project
+    _node_to_insight = IjokaClient._node_to_insight
+    _record_to_step = IjokaClient._record_to_step
+    _record_to_session = IjokaClient._record_to_session
+    _parse_datetime = IjokaClient._parse_datetime
+    _hierarchy_from_records = IjokaClient._hierarchy_from_records
+    _created_steps = IjokaClient._created_steps
+    _plan_from_records = IjokaClient._plan_from_records
+
+    def __init__(
+        self,
+        uri: str = "bolt://localhost:7687",
+        project_path: Optional[str] = None,
+        config: Optional[GraphDBConfig] = None,
+    ):
+        """
+        Initialize the async Ijoka client.
+
+        Args:
+            uri: Memgraph/Neo4j connection URI
+            project_path: Project path (auto-detected if not provided)
+            config: Connection pool settings (defaults if not provided)
+        """
+        self._uri = uri
+        self._config = config or GraphDBConfig(uri=uri)
+        self._driver: Optional[AsyncDriver] = None
+        self._project_path = project_path or self._detect_project_path()
+
+    @property
+    def driver(self) -> AsyncDriver:
+        """Lazy-load the async database driver."""
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                self._uri,
+                auth=("", ""),
+                max_connection_pool_size=self._config.max_connection_pool_size,
+                connection_acquisition_timeout=self._config.connection_acquisition_timeout,
+                keep_alive=True,
+            )
+            logger.debug(f"Connected to graph database at {self._uri} (async)")
+        return self._driver
+
+    @asynccontextmanager
+    async def session(
+        self,
+        mode: str = "READ",
+        fetch_size: Optional[int] = None,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get an async database session.
+
+        Args:
+            mode: READ or WRITE access mode
+            fetch_size: Records buffered per pull (driver default if not provided)
+        """
+        from neo4j import READ_ACCESS, WRITE_ACCESS
+        access_mode = READ_ACCESS if mode == "READ" else WRITE_ACCESS
+        config = {"fetch_size": fetch_size} if fetch_size else {}
+        async with self.driver.session(
+            database="memgraph",
+            default_access_mode=access_mode,
+            **config,
+        ) as session:
+            yield session
+
+    async def run_read(self, query: str, /, **params) -> list:
+        """
+        Run a read query in a managed transaction.
+
+        The driver retries transient failures. Records are collected inside
+        the transaction so they are fully consumed before commit.
+        """
+        async def _tx(tx):
+            result = await tx.run(query, **params)
+            return [record async for record in result]
+
+        async with self.session() as session:
+            return await session.execute_read(_tx)
+
+    async def run_write(self, query: str, /, **params) -> list:
+        """Run a write query in a managed transaction (see run_read)."""
+        async def _tx(tx):
+            result = await tx.run(query, **params)
+            return [record async for record in result]
+
+        async with self.session(mode="WRITE") as session:
+            return await session.execute_write(_tx)
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+
+    async def __aenter__(self) -> "AsyncIjokaClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # =========================================================================
+    # PROJECT OPERATIONS
+    # =========================================================================
+
+    async def get_project(self) -> Optional[Project]:
+        """Get the current project."""
+        records = await self.run_read(
+            _CYPHER_GET_PROJECT,
+            path=self._project_path,
+        )
+        record = records[0] if records else None
+        if not record:
+            return None
+        return self._node_to_project(record["p"])
+
+    async def ensure_project(self) -> Project:
+        """Get or create the current project."""
+        project = await self.get_project()
+        if project is not None:
+            return project
+
+        records = await self.run_write(
+            _CYPHER_ENSURE_PROJECT,
+            now=datetime.now(timezone.utc),
+            id=str(uuid.uuid4()),
+            path=self._project_path,
+            name=os.path.basename(self._project_path),
+        )
+        return self._node_to_project(records[0]["p"])
+
+    # =========================================================================
+    # FEATURE OPERATIONS
+    # =========================================================================
+
+    async def list_features(
+        self,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> list[FeatureListItem]:
+        """
+        List features with optional filtering.
+
+        Args:
+            status: Filter by status (pending, in_progress, blocked, complete)
+            category: Filter by category
+
+        Returns:
+            List of features sorted by priority (desc), created_at (asc)
+        """
+        records = await self.run_read(
+            _CYPHER_LIST_FEATURES,
+            path=self._project_path,
+            status=status or None,
+            category=category or None,
+        )
+        return [self._record_to_list_item(record) for record in records]
+
+    async def get_feature(self, feature_id: str) -> Optional[Feature]:
+        """Get a feature by ID."""
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_FEATURE,
+                id=feature_id,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(fetch_size=1) as session:
+            record = await session.execute_read(_tx)
+            if not record:
+                return None
+            return self._node_to_feature(record["f"])
+
+    async def get_active_feature(self) -> Optional[Feature]:
+        """Get the primary active feature, or first in_progress if no primary."""
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_PRIMARY_FEATURE,
+                path=self._project_path,
+            )
+            record = await result.single(strict=False)
+            if record:
+                return record
+
+            result = await tx.run(
+                _CYPHER_GET_TOP_ACTIVE_FEATURE,
+                path=self._project_path,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(fetch_size=1) as session:
+            record = await session.execute_read(_tx)
+            if not record:
+                return None
+            return self._node_to_feature(record["f"])
+
+    async def get_active_features(self) -> list[Feature]:
+        """Get ALL currently active (in_progress) features."""
+        records = await self.run_read(
+            _CYPHER_GET_ACTIVE_FEATURES,
+            path=self._project_path,
+        )
+        return [self._record_to_feature(record) for record in records]
+
+    async def set_primary_focus(self, feature_id: str) -> Feature:
+        """
+        Set a feature as the primary focus for event attribution.
+        Clears is_primary from all other features.
+        """
+        # Clear and set in one transaction so there is never a second primary
+        async def _tx(tx):
+            await tx.run(
+                _CYPHER_CLEAR_PRIMARY,
+                path=self._project_path,
+            )
+            result = await tx.run(
+                _CYPHER_SET_PRIMARY,
+                now=datetime.now(timezone.utc),
+                path=self._project_path,
+                id=feature_id,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(mode="WRITE") as session:
+            record = await session.execute_write(_tx)
+            if not record:
+                raise ValueError(f"Feature not found: {feature_id}")
+            return self._node_to_feature(record["f"])
+
+    async def get_next_feature(self) -> Optional[Feature]:
+        """Get the next available feature (highest priority pending)."""
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_NEXT_FEATURE,
+                path=self._project_path,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(fetch_size=1) as session:
+            record = await session.execute_read(_tx)
+            if not record:
+                return None
+            return self._node_to_feature(record["f"])
+
+    async def create_feature(
+        self,
+        description: str,
+        category: str,
+        priority: int = 50,
+        steps: Optional[list[str]] = None,
+        branch_hint: Optional[str] = None,
+        file_patterns: Optional[list[str]] = None,
+        work_item_type: str = "feature",
+        parent_id: Optional[str] = None,
+    ) -> Feature:
+        """Create a new feature."""
+        feature_id = str(uuid.uuid4())
+
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_CREATE_FEATURE,
+                now=datetime.now(timezone.utc),
+                path=self._project_path,
+                project_id=str(uuid.uuid4()),
+                project_name=os.path.basename(self._project_path),
+                id=feature_id,
+                description=description,
+                category=category,
+                type=work_item_type,
+                priority=priority,
+                steps=steps or [],
+                branch_hint=branch_hint,
+                file_patterns=file_patterns or [],
+                parent_id=parent_id,
+            )
+            record = await result.single()
+
+            # Create CHILD_OF relationship if parent specified
+            if parent_id:
+                await tx.run(
+                    _CYPHER_CREATE_CHILD_OF,
+                    child_id=feature_id,
+                    parent_id=parent_id,
+                )
+
+            return record
+
+        async with self.session(mode="WRITE") as session:
+            record = await session.execute_write(_tx)
+            return self._node_to_feature(record["f"])
+
+    async def start_feature(
+        self,
+        feature_id: Optional[str] = None,
+        agent: str = "cli",
+    ) -> Feature:
+        """
+        Start working on a feature.
+
+        Args:
+            feature_id: Feature ID (uses next available if not specified)
+            agent: Agent identifier
+
+        Returns:
+            The started feature
+        """
+        session_id = f"cli-{int(datetime.now().timestamp())}"
+
+        records = await self.run_write(
+            _CYPHER_START_FEATURE if feature_id else _CYPHER_START_NEXT_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+            path=self._project_path,
+            agent=agent,
+            session_id=session_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            if not feature_id:
+                raise ValueError("No pending features available")
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
+
+    async def complete_feature(
+        self,
+        feature_id: Optional[str] = None,
+        summary: Optional[str] = None,
+    ) -> Feature:
+        """
+        Mark a feature as complete.
+
+        Args:
+            feature_id: Feature ID (uses active feature if not specified)
+            summary: Completion summary
+
+        Returns:
+            The completed feature
+        """
+        if not feature_id:
+            active = await self.get_active_feature()
+            if not active:
+                raise ValueError("No active feature to complete")
+            feature_id = active.id
+
+        records = await self.run_write(
+            _CYPHER_COMPLETE_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
+
+    async def block_feature(
+        self,
+        feature_id: str,
+        reason: str,
+        blocking_feature_id: Optional[str] = None,
+    ) -> Feature:
+        """Mark a feature as blocked."""
+        records = await self.run_write(
+            _CYPHER_BLOCK_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+            reason=reason,
+            blocker_id=blocking_feature_id or "",
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
+
+    async def archive_feature(self, feature_id: str, reason: Optional[str] = None) -> bool:
+        """Archive (delete) a feature."""
+        records = await self.run_write(
+            _CYPHER_ARCHIVE_FEATURE,
+            id=feature_id,
+        )
+        record = records[0] if records else None
+        return record and record["deleted"] > 0
+
+    async def update_feature(
+        self,
+        feature_id: str,
+        description: Optional[str] = None,
+        category: Optional[str] = None,
+        priority: Optional[int] = None,
+    ) -> Feature:
+        """Update a feature's properties."""
+        if description is None and category is None and priority is None:
+            feat = await self.get_feature(feature_id)
+            if not feat:
+                raise ValueError(f"Feature not found: {feature_id}")
+            return feat
+
+        records = await self.run_write(
+            _CYPHER_UPDATE_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+            description=description,
+            category=category,
+            priority=priority,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
+
+    # =========================================================================
+    # HIERARCHY OPERATIONS
+    # =========================================================================
+
+    async def get_children(self, feature_id: str) -> list[Feature]:
+        """Get immediate children of a feature."""
+        records = await self.run_read(
+            _CYPHER_GET_CHILDREN,
+            id=feature_id,
+        )
+        return [self._record_to_feature(record) for record in records]
+
+    async def get_descendants(self, feature_id: str) -> list[Feature]:
+        """Get all descendants (children, grandchildren, etc.) of a feature."""
+        records = await self.run_read(
+            _CYPHER_GET_DESCENDANTS,
+            id=feature_id,
+        )
+        return [self._record_to_feature(record) for record in records]
+
+    async def get_ancestors(self, feature_id: str) -> list[Feature]:
+        """Get all ancestors (parent, grandparent, etc.) of a feature."""
+        records = await self.run_read(
+            _CYPHER_GET_ANCESTORS,
+            id=feature_id,
+        )
+        return [self._record_to_feature(record) for record in records]
+
+    async def get_hierarchy(self, feature_id: str) -> dict:
+        """
+        Get full hierarchy tree rooted at feature.
+        Returns dict with feature and nested children.
+        """
+        records = await self.run_read(
+            _CYPHER_GET_HIERARCHY,
+            id=feature_id,
+        )
+        return self._hierarchy_from_records(records, feature_id)
+
+    async def link_to_parent(self, feature_id: str, parent_id: str) -> Feature:
+        """Link feature to parent (creates CHILD_OF edge)."""
+        if feature_id == parent_id:
+            raise ValueError("Feature cannot be its own parent")
+
+        # Check for circular dependency
+        ancestors = await self.get_ancestors(parent_id)
+        if any(a.id == feature_id for a in ancestors):
+            raise ValueError("Circular dependency: feature is already an ancestor of proposed parent")
+
+        records = await self.run_write(
+            _CYPHER_LINK_TO_PARENT,
+            child_id=feature_id,
+            parent_id=parent_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError("Feature or parent not found")
+        return self._node_to_feature(record["child"])
+
+    async def unlink_from_parent(self, feature_id: str) -> Feature:
+        """Remove CHILD_OF relationship."""
+        records = await self.run_write(
+            _CYPHER_UNLINK_FROM_PARENT,
+            id=feature_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["child"])
+
+    async def get_descendant_events(self, feature_id: str, limit: int = 50) -> list[dict]:
+        """
+        Get events linked to feature AND all its descendants.
+        For aggregated event display on parent features.
+        """
+        records = await self.run_read(
+            _CYPHER_GET_DESCENDANT_EVENTS,
+            id=feature_id,
+            limit=limit,
+        )
+        return [
+            {**dict(record["e"]), "feature_id": record["feature_id"]}
+            for record in records
+        ]
+
+    # =========================================================================
+    # STATS OPERATIONS
+    # =========================================================================
+
+    async def get_stats(self) -> ProjectStats:
+        """Get project statistics."""
+        records = await self.run_read(
+            _CYPHER_GET_STATS,
+            path=self._project_path,
+        )
+        return _project_stats({record["status"]: record["count"] for record in records})
+
+    async def dashboard_snapshot(self, include_features: bool = True) -> dict:
+        """
+        Fetch everything a status dashboard shows in one go.
+
+        Args:
+            include_features: Also list the project's features
+
+        Returns:
+            Dict with: project, stats, active_feature, active_session, features
+        """
+        project, stats, active_feature, active_session, features = await asyncio.gather(
+            self.get_project(),
+            self.get_stats(),
+            self.get_active_feature(),
+            self.get_active_session(),
+            self.list_features() if include_features else asyncio.sleep(0),
+        )
+        if project is None:
+            # First visit to this project: create it once the reads are done
+            project = await self.ensure_project()
+        return {
+            "project": project,
+            "stats": stats,
+            "active_feature": active_feature,
+            "active_session": active_session,
+            "features": features,
+        }
+
+    # =========================================================================
+    # INSIGHT OPERATIONS
+    # =========================================================================
+
+    async def record_insight(
+        self,
+        description: str,
+        pattern_type: str,
+        tags: Optional[list[str]] = None,
+        feature_id: Optional[str] = None,
+    ) -> Insight:
+        """Record a new insight."""
+        records = await self.run_write(
+            _CYPHER_RECORD_INSIGHT,
+            now=datetime.now(timezone.utc),
+            id=str(uuid.uuid4()),
+            description=description,
+            pattern_type=pattern_type,
+            tags=tags or [],
+            feature_id=feature_id or "",
+        )
+        return self._node_to_insight(records[0]["i"])
+
+    async def list_insights(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> list[Insight]:
+        """List insights with optional filtering."""
+        records = await self.run_read(
+            _CYPHER_LIST_INSIGHTS,
+            query=query or None,
+            tags=tags or None,
+            limit=limit,
+        )
+        return [self._node_to_insight(record["i"]) for record in records]
+
+    # =========================================================================
+    # SESSION OPERATIONS
+    # =========================================================================
+
+    async def get_active_session(self) -> Optional[Session]:
+        """Get the active session for this project."""
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_ACTIVE_SESSION,
+                path=self._project_path,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(fetch_size=1) as db_session:
+            record = await db_session.execute_read(_tx)
+            if not record:
+                return None
+            return self._record_to_session(record)
+
+    # =========================================================================
+    # PLAN OPERATIONS
+    # =========================================================================
+
+    async def set_plan(self, feature_id: str, steps: list[str]) -> list[Step]:
+        """
+        Create Step nodes for a feature.
+
+        Args:
+            feature_id: Feature ID
+            steps: List of step descriptions
+
+        Returns:
+            List of created Step models
+        """
+        rows = [
+            {"id": str(uuid.uuid4()), "description": description, "step_order": idx}
+            for idx, description in enumerate(steps)
+        ]
+
+        # Replace the plan in one transaction
+        async def _tx(tx):
+            await tx.run(
+                _CYPHER_DELETE_STEPS,
+                id=feature_id,
+            )
+            result = await tx.run(
+                _CYPHER_CREATE_STEPS,
+                now=datetime.now(timezone.utc),
+                feature_id=feature_id,
+                rows=rows,
+            )
+            return [record async for record in result]
+
+        async with self.session(mode="WRITE") as session:
+            records = await session.execute_write(_tx)
+
+        return self._created_steps(records, feature_id, rows)
+
+    async def get_plan(self, feature_id: Optional[str] = None) -> dict:
+        """
+        Get plan steps with progress.
+
+        Args:
+            feature_id: Feature ID (uses active feature if not provided)
+
+        Returns:
+            Dict with: feature_id, steps, active_step, by_status, progress
+        """
+        if not feature_id:
+            active_feature = await self.get_active_feature()
+            if not active_feature:
+                raise ValueError("No active feature to get plan for")
+            feature_id = active_feature.id
+
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_PLAN,
+                id=feature_id,
+            )
+            return [record async for record in result]
+
+        async with self.session(fetch_size=1000) as session:
+            records = await session.execute_read(_tx)
+
+        return self._plan_from_records(records, feature_id)
+
+    async def get_plan_progress(self, feature_id: str) -> dict:
+        """
+        Get plan progress counts without fetching the steps.
+
+        Args:
+            feature_id: Feature ID
+
+        Returns:
+            Dict with: completed, total, percentage
+        """
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_PLAN_PROGRESS,
+                id=feature_id,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(fetch_size=1) as session:
+            record = await session.execute_read(_tx)
+
+        return _plan_progress(record)
+
+    async def get_active_step(self, feature_id: str) -> Optional[Step]:
+        """
+        Get the in_progress step for a feature.
+
+        Args:
+            feature_id: Feature ID
+
+        Returns:
+            The active step or None
+        """
+        async def _tx(tx):
+            result = await tx.run(
+                _CYPHER_GET_ACTIVE_STEP,
+                id=feature_id,
+            )
+            return await result.single(strict=False)
+
+        async with self.session(fetch_size=1) as session:
+            record = await session.execute_read(_tx)
+            if not record:
+                return None
+            return self._record_to_step(record, feature_id)
+
+    async def update_step_status(self, step_id: str, status: str) -> Step:
+        """
+        Update a step's status.
+
+        Args:
+            step_id: Step ID
+            status: New status (pending, in_progress, complete)
+
+        Returns:
+            Updated Step
+        """
+        records = await self.run_write(
+            _CYPHER_UPDATE_STEP_STATUS,
+            now=datetime.now(timezone.utc),
+            id=step_id,
+            status=status,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Step not found: {step_id}")
+        return self._record_to_step(record, record["feature_id"] or "")
+
+    async def checkpoint(
+        self,
+        feature_id: Optional[str] = None,
+        step_completed: Optional[str] = None,
+        current_activity: Optional[str] = None,
+    ) -> dict:
+        """
+        Report progress with drift detection.
+
+        Args:
+            feature_id: Feature ID (uses active feature if not provided)
+            step_completed: Step description that was completed
+            current_activity: What the agent is currently working on
+
+        Returns:
+            Dict with warnings list if drift detected
+        """
+        warnings = []
+
+        if feature_id:
+            active_feature = await self.get_feature(feature_id)
+        else:
+            active_feature = await self.get_active_feature()
+
+        if not active_feature:
+            warnings.append("No active feature - checkpoint ignored")
+            return {"warnings": warnings}
+
+        # Heartbeat checkpoints carry nothing to check against the plan
+        if not step_completed and not current_activity:
+            return {"warnings": warnings}
+
+        if step_completed:
+            # Match, complete and advance the active step server-side;
+            # the returned step is the one that was active on entry
+            records = await self.run_write(
+                _CYPHER_CHECKPOINT_STEP,
+                now=datetime.now(timezone.utc),
+                id=active_feature.id,
+                completed=step_completed,
+            )
+            active_step = (
+                self._record_to_step(records[0], active_feature.id) if records else None
+            )
+        else:
+            active_step = await self.get_active_step(active_feature.id)
+
+        drift = _drift_warning(current_activity, active_step)
+        if drift:
+            warnings.append(drift)
+
+        return {"warnings": warnings}
+
+    async def discover_feature(
+        self,
+        description: str,
+        category: str,
+        priority: int = 50,
+        steps: Optional[list[str]] = None,
+        lookback_minutes: int = 60,
+        mark_complete: bool = False,
+        work_item_type: str = "feature",
+    ) -> dict:
+        """
+        Create and activate a feature (optionally marking complete immediately).
+
+        Args:
+            description: Feature description
+            category: Feature category
+            priority: Priority (default 50)
+            steps: List of step descriptions
+            lookback_minutes: How far back to look for events to reattribute (future use)
+            mark_complete: If True, complete feature immediately instead of starting it
+
+        Returns:
+            Dict with feature and stats (reattributed_count currently always 0)
+        """
+        steps = steps or []
+        step_rows = [
+            {"id": str(uuid.uuid4()), "description": step, "step_order": idx}
+            for idx, step in enumerate(steps)
+        ]
+
+        records = await self.run_write(
+            _CYPHER_DISCOVER_FEATURE,
+            now=datetime.now(timezone.utc),
+            path=self._project_path,
+            project_id=str(uuid.uuid4()),
+            project_name=os.path.basename(self._project_path),
+            id=str(uuid.uuid4()),
+            description=description,
+            category=category,
+            type=work_item_type,
+            priority=priority,
+            steps=steps,
+            step_rows=step_rows,
+            mark_complete=mark_complete,
+            agent="cli",
+            session_id=f"cli-{int(datetime.now().timestamp())}",
+        )
+
+        return {
+            "feature": self._node_to_feature(records[0]["f"]),
+            "reattributed_count": 0,  # Placeholder for future implementation
+        }
+
+
+def get_async_client(project_path: Optional[str] = None) -> AsyncIjokaClient:
+    """Get an AsyncIjokaClient instance."""
+    uri = os.environ.get("IJOKA_DB_URI", "bolt://localhost:7687")
+    return AsyncIjokaClient(uri=uri, project_path=project_path)
@@ -10,6 +10,7 @@ Usage:
 
 import json
 import sys
+from dataclasses import asdict
 from typing import Annotated, Optional
 
 import typer
@@ -105,10 +106,11 @@ def status(
     client = get_client_safe()
 
     try:
-        project = client.ensure_project()
-        stats = client.get_stats()
-        active_feature = client.get_active_feature()
-        active_session = client.get_active_session()
+        snapshot = client.dashboard_snapshot(include_features=False)
+        project = snapshot["project"]
+        stats = snapshot["stats"]
+        active_feature = snapshot["active_feature"]
+        active_session = snapshot["active_session"]
 
         if json_output:
             data = {
@@ -197,7 +199,7 @@ def feature_list(
         if json_output:
             output_json({
                 "success": True,
-                "features": [f.model_dump() for f in features],
+                "features": [asdict(f) for f in features],
                 "count": len(features),
                 "stats": stats.model_dump(),
             })
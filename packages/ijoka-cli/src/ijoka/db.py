@@ -4,26 +4,39 @@ Graph database client for Ijoka.
 Provides connection to Memgraph/Neo4j for feature tracking and observability.
 """
 
+import atexit
+import copy
+import functools
 import os
 import re
 import subprocess
+import sys
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import datetime
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from fnmatch import fnmatch
-from typing import Generator, Optional
+from pathlib import Path
+from typing import Any, Generator, Optional
 
 from loguru import logger
 from neo4j import GraphDatabase, Driver, Session as Neo4jSession
 from pydantic import BaseModel
 
 from .models import (
+    FEATURE_CATEGORY_BY_VALUE,
+    FEATURE_STATUS_BY_VALUE,
+    INSIGHT_TYPE_BY_VALUE,
+    SESSION_STATUS_BY_VALUE,
+    STEP_STATUS_BY_VALUE,
+    WORK_ITEM_TYPE_BY_VALUE,
     Feature,
-    FeatureCategory,
     FeatureListItem,
-    FeatureStatus,
     Insight,
-    InsightType,
     Project,
     ProjectStats,
     Session,
@@ -32,6 +45,493 @@ from .models import (
     WorkItemType,
 )
 
+# Session shared by nested calls inside IjokaClient.shared_session()
+_current_session: ContextVar[Optional[tuple["IjokaClient", Neo4jSession]]] = ContextVar(
+    "ijoka_current_session", default=None
+)
+
+# Feature properties in model field order, which _record_to_feature unpacks;
+# deriving them keeps projections in step with the model
+_FEATURE_COLUMNS = tuple(Feature.model_fields)
+
+
+def _feature_projection(var: str) -> str:
+    """RETURN items projecting a feature node's properties as columns."""
+    return ", ".join(f"{var}.{column} AS {column}" for column in _FEATURE_COLUMNS)
+
+
+def _project_stats(counts: dict[str, int]) -> ProjectStats:
+    """Build ProjectStats from a status -> feature count histogram."""
+    total = sum(counts.values())
+    complete = counts.get("complete", 0)
+    return ProjectStats.model_construct(
+        total=total,
+        pending=counts.get("pending", 0),
+        in_progress=counts.get("in_progress", 0),
+        blocked=counts.get("blocked", 0),
+        complete=complete,
+        completion_percentage=round((complete / total) * 100) if total > 0 else 0,
+    )
+
+
+# =============================================================================
+# CYPHER
+# =============================================================================
+
+# Constant query text lets the server reuse cached plans; only parameters vary
+_CYPHER_GET_FEATURE = "MATCH (f:Feature {id: $id}) RETURN f"
+
+_CYPHER_LIST_FEATURES = """
+MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
+WHERE ($status IS NULL OR f.status = $status)
+  AND ($category IS NULL OR f.category = $category)
+WITH f
+ORDER BY f.priority DESC, f.created_at ASC
+RETURN f.id AS id,
+       f.description AS description,
+       f.category AS category,
+       f.type AS type,
+       f.status AS status,
+       f.priority AS priority,
+       f.is_primary AS is_primary,
+       f.work_count AS work_count,
+       f.assigned_agent AS assigned_agent
+"""
+
+_CYPHER_GET_PRIMARY_FEATURE = """
+MATCH (f:Feature {status: 'in_progress', is_primary: true})-[:BELONGS_TO]->(p:Project {path: $path})
+RETURN f
+LIMIT 1
+"""
+
+_CYPHER_GET_TOP_ACTIVE_FEATURE = """
+MATCH (f:Feature {status: 'in_progress'})-[:BELONGS_TO]->(p:Project {path: $path})
+RETURN f
+ORDER BY f.priority DESC
+LIMIT 1
+"""
+
+_CYPHER_GET_NEXT_FEATURE = """
+MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
+WHERE f.status = 'pending'
+RETURN f
+ORDER BY f.priority DESC, f.created_at ASC
+LIMIT 1
+"""
+
+_CYPHER_GET_STATS = """
+MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
+RETURN f.status AS status, count(f) AS count
+"""
+
+_CYPHER_LIST_INSIGHTS = """
+MATCH (i:Insight)
+WHERE CASE
+        WHEN $query IS NOT NULL THEN i.description CONTAINS $query
+        WHEN $tags IS NOT NULL THEN any(tag IN $tags WHERE tag IN i.tags)
+        ELSE true
+      END
+RETURN i
+ORDER BY i.usage_count DESC, i.created_at DESC
+LIMIT $limit
+"""
+
+_CYPHER_GET_PLAN = """
+MATCH (s:Step)-[:BELONGS_TO]->(f:Feature {id: $id})
+RETURN s.id AS id,
+       s.description AS description,
+       s.status AS status,
+       s.step_order AS step_order,
+       s.created_at AS created_at,
+       s.completed_at AS completed_at
+ORDER BY s.step_order ASC
+"""
+
+_CYPHER_GET_PLAN_PROGRESS = """
+MATCH (s:Step)-[:BELONGS_TO]->(f:Feature {id: $id})
+RETURN count(s) AS total,
+       sum(CASE WHEN s.status IN ['complete', 'completed'] THEN 1 ELSE 0 END) AS completed
+"""
+
+_CYPHER_GET_ACTIVE_STEP = """
+MATCH (s:Step {status: 'in_progress'})-[:BELONGS_TO]->(f:Feature {id: $id})
+RETURN s.id AS id,
+       s.description AS description,
+       s.status AS status,
+       s.step_order AS step_order,
+       s.created_at AS created_at,
+       s.completed_at AS completed_at
+LIMIT 1
+"""
+
+_CYPHER_CHECKPOINT_STEP = """
+MATCH (s:Step {status: 'in_progress'})-[:BELONGS_TO]->(f:Feature {id: $id})
+WITH s, f, toLower(s.description) CONTAINS toLower($completed) AS done
+LIMIT 1
+FOREACH (_ IN CASE WHEN done THEN [1] ELSE [] END |
+    SET s.status = 'completed', s.updated_at = $now, s.completed_at = $now
+)
+WITH s, f, done
+OPTIONAL MATCH (n:Step {status: 'pending'})-[:BELONGS_TO]->(f)
+WHERE done
+WITH s, done, n
+ORDER BY n.step_order ASC
+LIMIT 1
+FOREACH (_ IN CASE WHEN n IS NULL THEN [] ELSE [1] END |
+    SET n.status = 'in_progress', n.updated_at = $now
+)
+RETURN s.id AS id,
+       s.description AS description,
+       s.status AS status,
+       s.step_order AS step_order,
+       s.created_at AS created_at,
+       s.completed_at AS completed_at
+"""
+
+_CYPHER_UPDATE_STEP_STATUS = """
+MATCH (s:Step {id: $id})
+OPTIONAL MATCH (s)-[:BELONGS_TO]->(f:Feature)
+WITH s, f, $now AS now
+SET s.status = $status,
+    s.updated_at = now,
+    s.completed_at = CASE WHEN $status IN ['complete', 'completed']
+                          THEN now ELSE s.completed_at END
+RETURN s.id AS id,
+       coalesce(f.id, s.feature_id) AS feature_id,
+       s.description AS description,
+       s.status AS status,
+       s.step_order AS step_order,
+       s.created_at AS created_at,
+       s.completed_at AS completed_at
+"""
+
+_CYPHER_GET_ACTIVE_FEATURES = f"""
+MATCH (f:Feature {{status: 'in_progress'}})-[:BELONGS_TO]->(p:Project {{path: $path}})
+RETURN {_feature_projection("f")}
+ORDER BY is_primary DESC, priority DESC
+"""
+
+_CYPHER_GET_CHILDREN = f"""
+MATCH (child:Feature)-[:CHILD_OF]->(parent:Feature {{id: $id}})
+RETURN {_feature_projection("child")}
+ORDER BY priority DESC, created_at DESC
+"""
+
+_CYPHER_GET_DESCENDANTS = f"""
+MATCH (descendant:Feature)-[:CHILD_OF*]->(ancestor:Feature {{id: $id}})
+RETURN {_feature_projection("descendant")}
+ORDER BY priority DESC
+"""
+
+_CYPHER_GET_ANCESTORS = f"""
+MATCH (child:Feature {{id: $id}})-[:CHILD_OF*]->(ancestor:Feature)
+RETURN {_feature_projection("ancestor")}
+"""
+
+_CYPHER_GET_PROJECT = "MATCH (p:Project {path: $path}) RETURN p"
+
+_CYPHER_ENSURE_PROJECT = """
+MERGE (p:Project {path: $path})
+ON CREATE SET p.id = $id,
+              p.name = $name,
+              p.created_at = $now,
+              p.updated_at = $now
+RETURN p
+"""
+
+_CYPHER_CLEAR_PRIMARY = """
+MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
+WHERE f.is_primary = true
+SET f.is_primary = false
+"""
+
+_CYPHER_SET_PRIMARY = """
+MATCH (f:Feature {id: $id})-[:BELONGS_TO]->(p:Project {path: $path})
+SET f.is_primary = true, f.updated_at = $now
+RETURN f
+"""
+
+_CYPHER_CREATE_FEATURE = """
+MERGE (p:Project {path: $path})
+ON CREATE SET p.id = $project_id,
+              p.name = $project_name,
+              p.created_at = $now,
+              p.updated_at = $now
+CREATE (f:Feature {
+    id: $id,
+    description: $description,
+    category: $category,
+    type: $type,
+    status: 'pending',
+    priority: $priority,
+    steps: $steps,
+    branch_hint: $branch_hint,
+    file_patterns: $file_patterns,
+    work_count: 0,
+    parent_id: $parent_id,
+    created_at: $now,
+    updated_at: $now
+})-[:BELONGS_TO]->(p)
+RETURN f
+"""
+
+_CYPHER_CREATE_CHILD_OF = """
+MATCH (child:Feature {id: $child_id})
+MATCH (parent:Feature {id: $parent_id})
+CREATE (child)-[:CHILD_OF]->(parent)
+"""
+
+# Claim a feature; without an ID, pick the next pending one in the same
+# statement so two agents cannot start the same feature
+_START_FEATURE_SET = """
+SET f.status = 'in_progress',
+    f.assigned_agent = $agent,
+    f.claiming_session_id = $session_id,
+    f.claiming_agent = $agent,
+    f.claimed_at = $now,
+    f.updated_at = $now
+RETURN f
+"""
+
+_CYPHER_START_FEATURE = "MATCH (f:Feature {id: $id})" + _START_FEATURE_SET
+
+_CYPHER_START_NEXT_FEATURE = """
+MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
+WHERE f.status = 'pending'
+WITH f
+ORDER BY f.priority DESC, f.created_at ASC
+LIMIT 1
+""" + _START_FEATURE_SET
+
+_CYPHER_COMPLETE_FEATURE = """
+MATCH (f:Feature {id: $id})
+SET f.status = 'complete',
+    f.completed_at = $now,
+    f.updated_at = $now,
+    f.claiming_session_id = null,
+    f.claiming_agent = null,
+    f.claimed_at = null
+RETURN f
+"""
+
+_CYPHER_BLOCK_FEATURE = """
+MATCH (f:Feature {id: $id})
+SET f.status = 'blocked',
+    f.block_reason = $reason,
+    f.updated_at = $now
+WITH f
+OPTIONAL MATCH (blocker:Feature {id: $blocker_id})
+FOREACH (_ IN CASE WHEN blocker IS NULL THEN [] ELSE [1] END |
+    MERGE (f)-[:DEPENDS_ON {dependency_type: 'blocks'}]->(blocker)
+)
+RETURN f
+"""
+
+# Delete the feature together with its steps
+_CYPHER_ARCHIVE_FEATURE = """
+MATCH (f:Feature {id: $id})
+OPTIONAL MATCH (s:Step)-[:BELONGS_TO]->(f)
+DETACH DELETE s, f
+RETURN count(f) AS deleted
+"""
+
+# One canonical statement; coalesce keeps fields that were not given
+_CYPHER_UPDATE_FEATURE = """
+MATCH (f:Feature {id: $id})
+SET f.description = coalesce($description, f.description),
+    f.category = coalesce($category, f.category),
+    f.priority = coalesce($priority, f.priority),
+    f.updated_at = $now
+RETURN f
+"""
+
+# The root and every descendant with its parent, in one query
+_CYPHER_GET_HIERARCHY = """
+MATCH (root:Feature {id: $id})
+OPTIONAL MATCH (d:Feature)-[:CHILD_OF*]->(root)
+OPTIONAL MATCH (d)-[:CHILD_OF]->(parent:Feature)
+RETURN root, d, parent.id AS parent_id
+"""
+
+_CYPHER_LINK_TO_PARENT = """
+MATCH (child:Feature {id: $child_id})
+MATCH (parent:Feature {id: $parent_id})
+OPTIONAL MATCH (child)-[old:CHILD_OF]->(:Feature)
+DELETE old
+CREATE (child)-[:CHILD_OF]->(parent)
+SET child.parent_id = $parent_id
+RETURN child
+"""
+
+_CYPHER_UNLINK_FROM_PARENT = """
+MATCH (child:Feature {id: $id})
+OPTIONAL MATCH (child)-[r:CHILD_OF]->(:Feature)
+DELETE r
+SET child.parent_id = null
+RETURN child
+"""
+
+_CYPHER_GET_DESCENDANT_EVENTS = """
+MATCH (f:Feature {id: $id})
+OPTIONAL MATCH (descendant:Feature)-[:CHILD_OF*0..]->(f)
+WITH collect(DISTINCT f) + collect(DISTINCT descendant) as features
+UNWIND features as feature
+MATCH (e:Event)-[:LINKED_TO]->(feature)
+RETURN e, feature.id as feature_id
+ORDER BY e.timestamp DESC
+LIMIT $limit
+"""
+
+_CYPHER_RECORD_INSIGHT = """
+OPTIONAL MATCH (f:Feature {id: $feature_id})
+CREATE (i:Insight {
+    id: $id,
+    description: $description,
+    pattern_type: $pattern_type,
+    tags: $tags,
+    usage_count: 0,
+    created_at: $now
+})
+WITH i, f
+FOREACH (_ IN CASE WHEN f IS NULL THEN [] ELSE [1] END |
+    MERGE (i)-[:LEARNED_FROM]->(f)
+)
+RETURN i
+"""
+
+_CYPHER_GET_ACTIVE_SESSION = """
+MATCH (s:Session {status: 'active'})-[:IN_PROJECT]->(p:Project {path: $path})
+RETURN s.id AS id,
+       s.agent AS agent,
+       s.status AS status,
+       s.started_at AS started_at,
+       s.last_activity AS last_activity,
+       s.event_count AS event_count,
+       s.is_subagent AS is_subagent
+ORDER BY s.last_activity DESC
+LIMIT 1
+"""
+
+_CYPHER_DELETE_STEPS = "MATCH (s:Step)-[:BELONGS_TO]->(f:Feature {id: $id}) DETACH DELETE s"
+
+_CYPHER_CREATE_STEPS = """
+MATCH (f:Feature {id: $feature_id})
+WITH f, $now AS now
+UNWIND $rows AS row
+CREATE (s:Step {
+    id: row.id,
+    feature_id: $feature_id,
+    description: row.description,
+    status: 'pending',
+    step_order: row.step_order,
+    created_at: now,
+    updated_at: now
+})-[:BELONGS_TO]->(f)
+RETURN s
+ORDER BY s.step_order
+"""
+
+# Create, plan and start/complete a feature in a single statement
+_CYPHER_DISCOVER_FEATURE = """
+WITH $now AS now
+MERGE (p:Project {path: $path})
+ON CREATE SET p.id = $project_id,
+              p.name = $project_name,
+              p.created_at = now,
+              p.updated_at = now
+CREATE (f:Feature {
+    id: $id,
+    description: $description,
+    category: $category,
+    type: $type,
+    status: CASE WHEN $mark_complete THEN 'complete' ELSE 'in_progress' END,
+    priority: $priority,
+    steps: $steps,
+    file_patterns: [],
+    work_count: 0,
+    assigned_agent: CASE WHEN $mark_complete THEN null ELSE $agent END,
+    claiming_session_id: CASE WHEN $mark_complete THEN null ELSE $session_id END,
+    claiming_agent: CASE WHEN $mark_complete THEN null ELSE $agent END,
+    claimed_at: CASE WHEN $mark_complete THEN null ELSE now END,
+    completed_at: CASE WHEN $mark_complete THEN now ELSE null END,
+    created_at: now,
+    updated_at: now
+})-[:BELONGS_TO]->(p)
+FOREACH (row IN $step_rows |
+    CREATE (:Step {
+        id: row.id,
+        feature_id: $id,
+        description: row.description,
+        status: CASE WHEN NOT $mark_complete AND row.step_order = 0
+                     THEN 'in_progress' ELSE 'pending' END,
+        step_order: row.step_order,
+        created_at: now,
+        updated_at: now
+    })-[:BELONGS_TO]->(f)
+)
+RETURN f
+"""
+
+
+# Words ignored by checkpoint drift detection
+_STOP_WORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"})
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _drift_keywords(text: str) -> frozenset[str]:
+    """Lower-cased words of text minus stop words, ignoring punctuation."""
+    return frozenset(
+        word for word in _WORD_RE.findall(text.lower()) if word not in _STOP_WORDS
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _keywords_for_step(step_id: str, description: str) -> frozenset[str]:
+    """Drift keywords of a step, cached since step descriptions rarely change."""
+    return _drift_keywords(description)
+
+
+def _drift_warning(current_activity: Optional[str], active_step: Optional[Step]) -> Optional[str]:
+    """Warn when the reported activity shares no keywords with the active step."""
+    if not current_activity or not active_step:
+        return None
+
+    # Extract keywords from both (simple word-based overlap check)
+    activity_words = _drift_keywords(current_activity)
+    step_words = _keywords_for_step(active_step.id, active_step.description)
+
+    # Check for overlap
+    if activity_words and step_words and activity_words.isdisjoint(step_words):
+        return (
+            f"Potential drift: working on '{current_activity}' "
+            f"but active step is '{active_step.description}'"
+        )
+    return None
+
+
+def _plan_progress(record) -> dict:
+    """Build the get_plan_progress result from a _CYPHER_GET_PLAN_PROGRESS row."""
+    total = int(record["total"] or 0) if record else 0
+    completed = int(record["completed"] or 0) if record else 0
+    return {
+        "completed": completed,
+        "total": total,
+        "percentage": round((completed / total) * 100) if total > 0 else 0,
+    }
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality string column (agents, branches) shared across rows."""
+    return sys.intern(value) if value else value
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_native_datetime(value) -> Optional[datetime]:
+    """Native datetime for a neo4j temporal value (timestamps repeat across rows)."""
+    if hasattr(value, "to_native"):
+        return value.to_native()
+    return None
+
 
 class GraphDBConfig(BaseModel):
     """Database configuration."""
@@ -39,6 +539,105 @@ class GraphDBConfig(BaseModel):
     user: str = ""
     password: str = ""
     database: str = "memgraph"
+    max_connection_pool_size: int = 50
+    connection_acquisition_timeout: float = 60.0  # seconds
+    read_cache_ttl: float = 2.0  # seconds, 0 disables the read cache
+    read_cache_size: int = 256
+
+
+# Drivers are shared per (uri, auth, pool settings) so clients reuse one pool
+_DRIVER_CACHE: dict[tuple, Driver] = {}
+_DRIVER_LOCK = threading.Lock()
+
+
+def _get_shared_driver(uri: str, auth: tuple[str, str], config: GraphDBConfig) -> Driver:
+    """Get or create the pooled driver for a connection target."""
+    key = (uri, auth, config.max_connection_pool_size, config.connection_acquisition_timeout)
+    with _DRIVER_LOCK:
+        driver = _DRIVER_CACHE.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(
+                uri,
+                auth=auth,
+                max_connection_pool_size=config.max_connection_pool_size,
+                connection_acquisition_timeout=config.connection_acquisition_timeout,
+                keep_alive=True,
+            )
+            _DRIVER_CACHE[key] = driver
+            logger.debug(f"Connected to graph database at {uri}")
+        return driver
+
+
+@atexit.register
+def _close_shared_drivers() -> None:
+    """Close all pooled drivers at interpreter exit."""
+    with _DRIVER_LOCK:
+        for driver in _DRIVER_CACHE.values():
+            driver.close()
+        _DRIVER_CACHE.clear()
+
+
+def _cached(method):
+    """
+    Cache a read method's result for ``read_cache_ttl`` seconds.
+
+    Write sessions clear the cache and bump the client's write version;
+    the version is part of the key so a read overlapping a write is not
+    stored. Cached values are deep-copied in and out, so callers may
+    mutate what they get back.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        ttl = self._config.read_cache_ttl
+        if ttl <= 0:
+            return method(self, *args, **kwargs)
+
+        key = (name, args, tuple(sorted(kwargs.items())), self._write_version)
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
+        value = method(self, *args, **kwargs)
+        with self._cache_lock:
+            if key[-1] == self._write_version:
+                self._cache[key] = (now + ttl, copy.deepcopy(value))
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._config.read_cache_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_git_root(cwd: str) -> str:
+    """
+    Find the git root for a directory.
+
+    Walks up looking for a .git entry before falling back to forking
+    ``git rev-parse``; the result is cached for the process.
+    """
+    start = Path(cwd).resolve()
+    for directory in (start, *start.parents):
+        if (directory / ".git").exists():
+            return str(directory)
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+        return result.stdout.strip()
+    except subprocess.CalledProcessError:
+        return cwd
 
 
 class IjokaClient:
@@ -55,6 +654,7 @@ class IjokaClient:
         self,
         uri: str = "bolt://localhost:7687",
         project_path: Optional[str] = None,
+        config: Optional[GraphDBConfig] = None,
     ):
         """
         Initialize the Ijoka client.
@@ -62,111 +662,192 @@ class IjokaClient:
         Args:
             uri: Memgraph/Neo4j connection URI
             project_path: Project path (auto-detected if not provided)
+            config: Connection pool settings (defaults if not provided)
         """
         self._uri = uri
+        self._config = config or GraphDBConfig(uri=uri)
         self._driver: Optional[Driver] = None
         self._project_path = project_path or self._detect_project_path()
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._write_version = 0
 
     def _detect_project_path(self) -> str:
-        """Detect project path using git root."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            return os.getcwd()
+        """Detect project path from IJOKA_PROJECT_PATH or the git root."""
+        env_path = os.environ.get("IJOKA_PROJECT_PATH")
+        if env_path:
+            return env_path
+        return _detect_git_root(os.getcwd())
 
     @property
     def driver(self) -> Driver:
-        """Lazy-load the database driver."""
+        """Lazy-load the shared database driver."""
         if self._driver is None:
-            self._driver = GraphDatabase.driver(self._uri, auth=("", ""))
-            logger.debug(f"Connected to graph database at {self._uri}")
+            self._driver = _get_shared_driver(self._uri, ("", ""), self._config)
         return self._driver
 
     @contextmanager
-    def session(self, mode: str = "READ") -> Generator[Neo4jSession, None, None]:
-        """Get a database session."""
+    def session(
+        self,
+        mode: str = "READ",
+        fetch_size: Optional[int] = None,
+    ) -> Generator[Neo4jSession, None, None]:
+        """
+        Get a database session.
+
+        Args:
+            mode: READ or WRITE access mode
+            fetch_size: Records buffered per pull (driver default if not provided)
+        """
         from neo4j import READ_ACCESS, WRITE_ACCESS
         access_mode = READ_ACCESS if mode == "READ" else WRITE_ACCESS
-        session = self.driver.session(database="memgraph", default_access_mode=access_mode)
+
+        shared = _current_session.get()
+        if shared is not None and shared[0] is self:
+            if access_mode == WRITE_ACCESS:
+                self._invalidate_cache()
+            try:
+                yield shared[1]
+            finally:
+                if access_mode == WRITE_ACCESS:
+                    self._invalidate_cache()
+            return
+
+        if access_mode == WRITE_ACCESS:
+            self._invalidate_cache()
+        try:
+            with self._pooled_session(access_mode, fetch_size) as session:
+                yield session
+        finally:
+            if access_mode == WRITE_ACCESS:
+                self._invalidate_cache()
+
+    @contextmanager
+    def _pooled_session(
+        self,
+        access_mode: str,
+        fetch_size: Optional[int] = None,
+    ) -> Generator[Neo4jSession, None, None]:
+        """Acquire a driver session from the pool, without touching the read cache."""
+        config = {"fetch_size": fetch_size} if fetch_size else {}
+        session = self.driver.session(
+            database="memgraph",
+            default_access_mode=access_mode,
+            **config,
+        )
         try:
             yield session
         finally:
             session.close()
 
+    @contextmanager
+    def shared_session(self, mode: str = "WRITE") -> Generator[Neo4jSession, None, None]:
+        """
+        Reuse one session for every query made inside the block.
+
+        Nested ``session()`` calls on this client yield the shared session
+        instead of acquiring another connection from the pool. Each query
+        still runs in its own transaction. Opening the block does not clear
+        the read cache; nested write calls do, so a block that only reads
+        keeps its cached results.
+
+        Args:
+            mode: READ or WRITE access mode
+        """
+        shared = _current_session.get()
+        if shared is not None and shared[0] is self:
+            yield shared[1]
+            return
+
+        from neo4j import READ_ACCESS, WRITE_ACCESS
+        access_mode = READ_ACCESS if mode == "READ" else WRITE_ACCESS
+
+        with self._pooled_session(access_mode) as session:
+            token = _current_session.set((self, session))
+            try:
+                yield session
+            finally:
+                _current_session.reset(token)
+
+    def run_read(self, query: str, /, **params) -> list:
+        """
+        Run a read query in a managed transaction.
+
+        The driver retries transient failures. Records are collected inside
+        the transaction so they are fully consumed before commit.
+        """
+        def _tx(tx):
+            return list(tx.run(query, **params))
+
+        with self.session() as session:
+            return session.execute_read(_tx)
+
+    def run_write(self, query: str, /, **params) -> list:
+        """Run a write query in a managed transaction (see run_read)."""
+        def _tx(tx):
+            return list(tx.run(query, **params))
+
+        with self.session(mode="WRITE") as session:
+            return session.execute_write(_tx)
+
+    @property
+    def data_version(self) -> int:
+        """Counter bumped by every write through this client (for callers' caches)."""
+        return self._write_version
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached reads after a write."""
+        with self._cache_lock:
+            self._write_version += 1
+            self._cache.clear()
+
     def close(self) -> None:
-        """Close the database connection."""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """
+        Release this client's handle on the database driver.
+
+        The pooled driver itself stays open for other clients and is
+        closed at interpreter exit.
+        """
+        self._driver = None
 
     # =========================================================================
     # PROJECT OPERATIONS
     # =========================================================================
 
+    @_cached
     def get_project(self) -> Optional[Project]:
         """Get the current project."""
-        with self.session() as session:
-            result = session.run(
-                "MATCH (p:Project {path: $path}) RETURN p",
-                path=self._project_path,
-            )
-            record = result.single()
-            if not record:
-                return None
-            node = record["p"]
-            return Project(
-                id=node["id"],
-                path=node["path"],
-                name=node["name"],
-                description=node.get("description"),
-                created_at=self._parse_datetime(node.get("created_at")),
-                updated_at=self._parse_datetime(node.get("updated_at")),
-            )
+        records = self.run_read(
+            _CYPHER_GET_PROJECT,
+            path=self._project_path,
+        )
+        record = records[0] if records else None
+        if not record:
+            return None
+        return self._node_to_project(record["p"])
 
     def ensure_project(self) -> Project:
         """Get or create the current project."""
+        # Only a missing project needs the MERGE; a write would also flush
+        # the read cache for the reads that usually follow this call
         project = self.get_project()
-        if project:
+        if project is not None:
             return project
 
-        project_id = str(uuid.uuid4())
-        name = os.path.basename(self._project_path)
-
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                CREATE (p:Project {
-                    id: $id,
-                    path: $path,
-                    name: $name,
-                    created_at: datetime(),
-                    updated_at: datetime()
-                })
-                RETURN p
-                """,
-                id=project_id,
-                path=self._project_path,
-                name=name,
-            )
-            node = result.single()["p"]
-            return Project(
-                id=node["id"],
-                path=node["path"],
-                name=node["name"],
-                created_at=self._parse_datetime(node.get("created_at")),
-                updated_at=self._parse_datetime(node.get("updated_at")),
-            )
+        records = self.run_write(
+            _CYPHER_ENSURE_PROJECT,
+            now=datetime.now(timezone.utc),
+            id=str(uuid.uuid4()),
+            path=self._project_path,
+            name=os.path.basename(self._project_path),
+        )
+        return self._node_to_project(records[0]["p"])
 
     # =========================================================================
     # FEATURE OPERATIONS
     # =========================================================================
 
+    @_cached
     def list_features(
         self,
         status: Optional[str] = None,
@@ -182,141 +863,98 @@ class IjokaClient:
         Returns:
             List of features sorted by priority (desc), created_at (asc)
         """
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
-                RETURN f
-                ORDER BY f.priority DESC, f.created_at ASC
-                """,
-                path=self._project_path,
-            )
-            features = []
-            for record in result:
-                node = record["f"]
-                feat = FeatureListItem(
-                    id=node["id"],
-                    description=node["description"],
-                    category=FeatureCategory(node["category"]),
-                    type=WorkItemType(node.get("type", "feature")),
-                    status=FeatureStatus(node["status"]),
-                    priority=int(node.get("priority", 0)),
-                    is_primary=bool(node.get("is_primary", False)),
-                    work_count=int(node.get("work_count", 0)),
-                    assigned_agent=node.get("assigned_agent"),
-                )
-
-                # Apply filters
-                if status and feat.status.value != status:
-                    continue
-                if category and feat.category.value != category:
-                    continue
-
-                features.append(feat)
-
-            return features
+        records = self.run_read(
+            _CYPHER_LIST_FEATURES,
+            path=self._project_path,
+            status=status or None,
+            category=category or None,
+        )
+        return [self._record_to_list_item(record) for record in records]
 
+    @_cached
     def get_feature(self, feature_id: str) -> Optional[Feature]:
         """Get a feature by ID."""
-        with self.session() as session:
-            result = session.run(
-                "MATCH (f:Feature {id: $id}) RETURN f",
+        def _tx(tx):
+            return tx.run(
+                _CYPHER_GET_FEATURE,
                 id=feature_id,
-            )
-            record = result.single()
+            ).single(strict=False)
+
+        with self.session(fetch_size=1) as session:
+            record = session.execute_read(_tx)
             if not record:
                 return None
             return self._node_to_feature(record["f"])
 
+    @_cached
     def get_active_feature(self) -> Optional[Feature]:
         """Get the primary active feature, or first in_progress if no primary."""
-        with self.session() as session:
+        def _tx(tx):
             # First try to get the primary feature
-            result = session.run(
-                """
-                MATCH (f:Feature {status: 'in_progress', is_primary: true})-[:BELONGS_TO]->(p:Project {path: $path})
-                RETURN f
-                LIMIT 1
-                """,
+            record = tx.run(
+                _CYPHER_GET_PRIMARY_FEATURE,
                 path=self._project_path,
-            )
-            record = result.single()
+            ).single(strict=False)
             if record:
-                return self._node_to_feature(record["f"])
+                return record
 
             # Fallback to any in_progress feature
-            result = session.run(
-                """
-                MATCH (f:Feature {status: 'in_progress'})-[:BELONGS_TO]->(p:Project {path: $path})
-                RETURN f
-                ORDER BY f.priority DESC
-                LIMIT 1
-                """,
+            return tx.run(
+                _CYPHER_GET_TOP_ACTIVE_FEATURE,
                 path=self._project_path,
-            )
-            record = result.single()
+            ).single(strict=False)
+
+        with self.session(fetch_size=1) as session:
+            record = session.execute_read(_tx)
             if not record:
                 return None
             return self._node_to_feature(record["f"])
 
     def get_active_features(self) -> list[Feature]:
         """Get ALL currently active (in_progress) features."""
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (f:Feature {status: 'in_progress'})-[:BELONGS_TO]->(p:Project {path: $path})
-                RETURN f
-                ORDER BY f.is_primary DESC, f.priority DESC
-                """,
-                path=self._project_path,
-            )
-            return [self._node_to_feature(record["f"]) for record in result]
+        records = self.run_read(
+            _CYPHER_GET_ACTIVE_FEATURES,
+            path=self._project_path,
+        )
+        return [self._record_to_feature(record) for record in records]
 
     def set_primary_focus(self, feature_id: str) -> Feature:
         """
         Set a feature as the primary focus for event attribution.
         Clears is_primary from all other features.
         """
-        with self.session(mode="WRITE") as session:
+        # Clear and set in one transaction so there is never a second primary
+        def _tx(tx):
             # Clear all existing primary flags
-            session.run(
-                """
-                MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
-                WHERE f.is_primary = true
-                SET f.is_primary = false
-                """,
+            tx.run(
+                _CYPHER_CLEAR_PRIMARY,
                 path=self._project_path,
             )
 
             # Set the new primary
-            result = session.run(
-                """
-                MATCH (f:Feature {id: $id})-[:BELONGS_TO]->(p:Project {path: $path})
-                SET f.is_primary = true, f.updated_at = datetime()
-                RETURN f
-                """,
+            return tx.run(
+                _CYPHER_SET_PRIMARY,
+                now=datetime.now(timezone.utc),
                 path=self._project_path,
                 id=feature_id,
-            )
-            record = result.single()
+            ).single(strict=False)
+
+        with self.session(mode="WRITE") as session:
+            record = session.execute_write(_tx)
             if not record:
                 raise ValueError(f"Feature not found: {feature_id}")
             return self._node_to_feature(record["f"])
 
     def get_next_feature(self) -> Optional[Feature]:
         """Get the next available feature (highest priority pending)."""
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (f:Feature)-[:BELONGS_TO]->(p:Project {path: $path})
-                WHERE f.status = 'pending'
-                RETURN f
-                ORDER BY f.priority DESC, f.created_at ASC
-                LIMIT 1
-                """,
+        def _tx(tx):
+            return tx.run(
+                _CYPHER_GET_NEXT_FEATURE,
                 path=self._project_path,
-            )
-            record = result.single()
+            ).single(strict=False)
+
+        with self.session(fetch_size=1) as session:
+            record = session.execute_read(_tx)
             if not record:
                 return None
             return self._node_to_feature(record["f"])
@@ -333,31 +971,15 @@ class IjokaClient:
         parent_id: Optional[str] = None,
     ) -> Feature:
         """Create a new feature."""
-        self.ensure_project()
         feature_id = str(uuid.uuid4())
 
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                MATCH (p:Project {path: $path})
-                CREATE (f:Feature {
-                    id: $id,
-                    description: $description,
-                    category: $category,
-                    type: $type,
-                    status: 'pending',
-                    priority: $priority,
-                    steps: $steps,
-                    branch_hint: $branch_hint,
-                    file_patterns: $file_patterns,
-                    work_count: 0,
-                    parent_id: $parent_id,
-                    created_at: datetime(),
-                    updated_at: datetime()
-                })-[:BELONGS_TO]->(p)
-                RETURN f
-                """,
+        def _tx(tx):
+            record = tx.run(
+                _CYPHER_CREATE_FEATURE,
+                now=datetime.now(timezone.utc),
                 path=self._project_path,
+                project_id=str(uuid.uuid4()),
+                project_name=os.path.basename(self._project_path),
                 id=feature_id,
                 description=description,
                 category=category,
@@ -367,21 +989,21 @@ class IjokaClient:
                 branch_hint=branch_hint,
                 file_patterns=file_patterns or [],
                 parent_id=parent_id,
-            )
+            ).single()
 
             # Create CHILD_OF relationship if parent specified
             if parent_id:
-                session.run(
-                    """
-                    MATCH (child:Feature {id: $child_id})
-                    MATCH (parent:Feature {id: $parent_id})
-                    CREATE (child)-[:CHILD_OF]->(parent)
-                    """,
+                tx.run(
+                    _CYPHER_CREATE_CHILD_OF,
                     child_id=feature_id,
                     parent_id=parent_id,
                 )
 
-            return self._node_to_feature(result.single()["f"])
+            return record
+
+        with self.session(mode="WRITE") as session:
+            record = session.execute_write(_tx)
+            return self._node_to_feature(record["f"])
 
     def start_feature(
         self,
@@ -398,34 +1020,22 @@ class IjokaClient:
         Returns:
             The started feature
         """
-        if not feature_id:
-            next_feat = self.get_next_feature()
-            if not next_feat:
-                raise ValueError("No pending features available")
-            feature_id = next_feat.id
-
         session_id = f"cli-{int(datetime.now().timestamp())}"
 
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                MATCH (f:Feature {id: $id})
-                SET f.status = 'in_progress',
-                    f.assigned_agent = $agent,
-                    f.claiming_session_id = $session_id,
-                    f.claiming_agent = $agent,
-                    f.claimed_at = datetime(),
-                    f.updated_at = datetime()
-                RETURN f
-                """,
-                id=feature_id,
-                agent=agent,
-                session_id=session_id,
-            )
-            record = result.single()
-            if not record:
-                raise ValueError(f"Feature not found: {feature_id}")
-            return self._node_to_feature(record["f"])
+        records = self.run_write(
+            _CYPHER_START_FEATURE if feature_id else _CYPHER_START_NEXT_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+            path=self._project_path,
+            agent=agent,
+            session_id=session_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            if not feature_id:
+                raise ValueError("No pending features available")
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
 
     def complete_feature(
         self,
@@ -442,27 +1052,19 @@ class IjokaClient:
         Returns:
             The completed feature
         """
-        if not feature_id:
-            active = self.get_active_feature()
-            if not active:
-                raise ValueError("No active feature to complete")
-            feature_id = active.id
-
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                MATCH (f:Feature {id: $id})
-                SET f.status = 'complete',
-                    f.completed_at = datetime(),
-                    f.updated_at = datetime(),
-                    f.claiming_session_id = null,
-                    f.claiming_agent = null,
-                    f.claimed_at = null
-                RETURN f
-                """,
+        with self.shared_session():
+            if not feature_id:
+                active = self.get_active_feature()
+                if not active:
+                    raise ValueError("No active feature to complete")
+                feature_id = active.id
+
+            records = self.run_write(
+                _CYPHER_COMPLETE_FEATURE,
+                now=datetime.now(timezone.utc),
                 id=feature_id,
             )
-            record = result.single()
+            record = records[0] if records else None
             if not record:
                 raise ValueError(f"Feature not found: {feature_id}")
             return self._node_to_feature(record["f"])
@@ -474,51 +1076,26 @@ class IjokaClient:
         blocking_feature_id: Optional[str] = None,
     ) -> Feature:
         """Mark a feature as blocked."""
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                MATCH (f:Feature {id: $id})
-                SET f.status = 'blocked',
-                    f.block_reason = $reason,
-                    f.updated_at = datetime()
-                RETURN f
-                """,
-                id=feature_id,
-                reason=reason,
-            )
-            record = result.single()
-            if not record:
-                raise ValueError(f"Feature not found: {feature_id}")
-
-            # Create blocking relationship if specified
-            if blocking_feature_id:
-                session.run(
-                    """
-                    MATCH (f:Feature {id: $id})
-                    MATCH (blocker:Feature {id: $blocker_id})
-                    MERGE (f)-[:DEPENDS_ON {dependency_type: 'blocks'}]->(blocker)
-                    """,
-                    id=feature_id,
-                    blocker_id=blocking_feature_id,
-                )
-
-            return self._node_to_feature(record["f"])
+        records = self.run_write(
+            _CYPHER_BLOCK_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+            reason=reason,
+            blocker_id=blocking_feature_id or "",
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
 
     def archive_feature(self, feature_id: str, reason: Optional[str] = None) -> bool:
         """Archive (delete) a feature."""
-        with self.session(mode="WRITE") as session:
-            # Delete related steps first
-            session.run(
-                "MATCH (s:Step)-[:BELONGS_TO]->(f:Feature {id: $id}) DETACH DELETE s",
-                id=feature_id,
-            )
-            # Delete the feature
-            result = session.run(
-                "MATCH (f:Feature {id: $id}) DETACH DELETE f RETURN count(f) as deleted",
-                id=feature_id,
-            )
-            record = result.single()
-            return record and record["deleted"] > 0
+        records = self.run_write(
+            _CYPHER_ARCHIVE_FEATURE,
+            id=feature_id,
+        )
+        record = records[0] if records else None
+        return record and record["deleted"] > 0
 
     def update_feature(
         self,
@@ -528,36 +1105,24 @@ class IjokaClient:
         priority: Optional[int] = None,
     ) -> Feature:
         """Update a feature's properties."""
-        updates = []
-        params = {"id": feature_id}
-
-        if description is not None:
-            updates.append("f.description = $description")
-            params["description"] = description
-        if category is not None:
-            updates.append("f.category = $category")
-            params["category"] = category
-        if priority is not None:
-            updates.append("f.priority = $priority")
-            params["priority"] = priority
-
-        if not updates:
+        if description is None and category is None and priority is None:
             feat = self.get_feature(feature_id)
             if not feat:
                 raise ValueError(f"Feature not found: {feature_id}")
             return feat
 
-        updates.append("f.updated_at = datetime()")
-
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                f"MATCH (f:Feature {{id: $id}}) SET {', '.join(updates)} RETURN f",
-                **params,
-            )
-            record = result.single()
-            if not record:
-                raise ValueError(f"Feature not found: {feature_id}")
-            return self._node_to_feature(record["f"])
+        records = self.run_write(
+            _CYPHER_UPDATE_FEATURE,
+            now=datetime.now(timezone.utc),
+            id=feature_id,
+            description=description,
+            category=category,
+            priority=priority,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["f"])
 
     # =========================================================================
     # HIERARCHY OPERATIONS
@@ -565,167 +1130,161 @@ class IjokaClient:
 
     def get_children(self, feature_id: str) -> list[Feature]:
         """Get immediate children of a feature."""
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (child:Feature)-[:CHILD_OF]->(parent:Feature {id: $id})
-                RETURN child
-                ORDER BY child.priority DESC, child.created_at DESC
-                """,
-                id=feature_id,
-            )
-            return [self._node_to_feature(record["child"]) for record in result]
+        records = self.run_read(
+            _CYPHER_GET_CHILDREN,
+            id=feature_id,
+        )
+        return [self._record_to_feature(record) for record in records]
 
     def get_descendants(self, feature_id: str) -> list[Feature]:
         """Get all descendants (children, grandchildren, etc.) of a feature."""
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (descendant:Feature)-[:CHILD_OF*]->(ancestor:Feature {id: $id})
-                RETURN descendant
-                ORDER BY descendant.priority DESC
-                """,
-                id=feature_id,
-            )
-            return [self._node_to_feature(record["descendant"]) for record in result]
+        records = self.run_read(
+            _CYPHER_GET_DESCENDANTS,
+            id=feature_id,
+        )
+        return [self._record_to_feature(record) for record in records]
 
     def get_ancestors(self, feature_id: str) -> list[Feature]:
         """Get all ancestors (parent, grandparent, etc.) of a feature."""
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (child:Feature {id: $id})-[:CHILD_OF*]->(ancestor:Feature)
-                RETURN ancestor
-                """,
-                id=feature_id,
-            )
-            return [self._node_to_feature(record["ancestor"]) for record in result]
+        records = self.run_read(
+            _CYPHER_GET_ANCESTORS,
+            id=feature_id,
+        )
+        return [self._record_to_feature(record) for record in records]
 
     def get_hierarchy(self, feature_id: str) -> dict:
         """
         Get full hierarchy tree rooted at feature.
         Returns dict with feature and nested children.
         """
-        feature = self.get_feature(feature_id)
-        if not feature:
+        records = self.run_read(
+            _CYPHER_GET_HIERARCHY,
+            id=feature_id,
+        )
+        return self._hierarchy_from_records(records, feature_id)
+
+    def _hierarchy_from_records(self, records: list, feature_id: str) -> dict:
+        """Nest _CYPHER_GET_HIERARCHY rows into the get_hierarchy tree."""
+        if not records:
             return {}
 
-        children = self.get_children(feature_id)
+        features = {feature_id: self._node_to_feature(records[0]["root"])}
+        children: dict[str, list[Feature]] = {}
+        for record in records:
+            if record["d"] is None:
+                continue
+            feature = self._node_to_feature(record["d"])
+            if feature.id in features:
+                continue
+            features[feature.id] = feature
+            children.setdefault(record["parent_id"], []).append(feature)
+
+        def _build(feature: Feature) -> dict:
+            kids = sorted(
+                children.get(feature.id, []),
+                key=lambda f: (f.priority, f.created_at.timestamp() if f.created_at else 0),
+                reverse=True,
+            )
+            subtrees = [_build(kid) for kid in kids]
+            return {
+                "feature": feature,
+                "children": subtrees,
+                "child_count": len(kids),
+                "descendant_count": sum(1 + tree["descendant_count"] for tree in subtrees),
+            }
 
-        return {
-            "feature": feature,
-            "children": [self.get_hierarchy(child.id) for child in children],
-            "child_count": len(children),
-            "descendant_count": len(self.get_descendants(feature_id)),
-        }
+        return _build(features[feature_id])
 
     def link_to_parent(self, feature_id: str, parent_id: str) -> Feature:
         """Link feature to parent (creates CHILD_OF edge)."""
         if feature_id == parent_id:
             raise ValueError("Feature cannot be its own parent")
 
-        with self.session(mode="WRITE") as session:
-            # Check for circular dependency
-            ancestors = self.get_ancestors(parent_id)
-            if any(a.id == feature_id for a in ancestors):
-                raise ValueError("Circular dependency: feature is already an ancestor of proposed parent")
-
-            result = session.run(
-                """
-                MATCH (child:Feature {id: $child_id})
-                MATCH (parent:Feature {id: $parent_id})
-                OPTIONAL MATCH (child)-[old:CHILD_OF]->(:Feature)
-                DELETE old
-                CREATE (child)-[:CHILD_OF]->(parent)
-                SET child.parent_id = $parent_id
-                RETURN child
-                """,
-                child_id=feature_id,
-                parent_id=parent_id,
-            )
-            record = result.single()
-            if not record:
-                raise ValueError(f"Feature or parent not found")
-            return self._node_to_feature(record["child"])
+        # Check for circular dependency
+        ancestors = self.get_ancestors(parent_id)
+        if any(a.id == feature_id for a in ancestors):
+            raise ValueError("Circular dependency: feature is already an ancestor of proposed parent")
+
+        records = self.run_write(
+            _CYPHER_LINK_TO_PARENT,
+            child_id=feature_id,
+            parent_id=parent_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature or parent not found")
+        return self._node_to_feature(record["child"])
 
     def unlink_from_parent(self, feature_id: str) -> Feature:
         """Remove CHILD_OF relationship."""
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                MATCH (child:Feature {id: $id})
-                OPTIONAL MATCH (child)-[r:CHILD_OF]->(:Feature)
-                DELETE r
-                SET child.parent_id = null
-                RETURN child
-                """,
-                id=feature_id,
-            )
-            record = result.single()
-            if not record:
-                raise ValueError(f"Feature not found: {feature_id}")
-            return self._node_to_feature(record["child"])
+        records = self.run_write(
+            _CYPHER_UNLINK_FROM_PARENT,
+            id=feature_id,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return self._node_to_feature(record["child"])
 
     def get_descendant_events(self, feature_id: str, limit: int = 50) -> list[dict]:
         """
         Get events linked to feature AND all its descendants.
         For aggregated event display on parent features.
         """
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (f:Feature {id: $id})
-                OPTIONAL MATCH (descendant:Feature)-[:CHILD_OF*0..]->(f)
-                WITH collect(DISTINCT f) + collect(DISTINCT descendant) as features
-                UNWIND features as feature
-                MATCH (e:Event)-[:LINKED_TO]->(feature)
-                RETURN e, feature.id as feature_id
-                ORDER BY e.timestamp DESC
-                LIMIT $limit
-                """,
-                id=feature_id,
-                limit=limit,
-            )
-            return [
-                {**dict(record["e"]), "feature_id": record["feature_id"]}
-                for record in result
-            ]
+        records = self.run_read(
+            _CYPHER_GET_DESCENDANT_EVENTS,
+            id=feature_id,
+            limit=limit,
+        )
+        return [
+            {**dict(record["e"]), "feature_id": record["feature_id"]}
+            for record in records
+        ]
 
     # =========================================================================
     # STATS OPERATIONS
     # =========================================================================
 
+    @_cached
     def get_stats(self) -> ProjectStats:
         """Get project statistics."""
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (p:Project {path: $path})
-                OPTIONAL MATCH (f:Feature)-[:BELONGS_TO]->(p)
-                WITH p,
-                     count(f) as total,
-                     sum(CASE WHEN f.status = 'pending' THEN 1 ELSE 0 END) as pending,
-                     sum(CASE WHEN f.status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                     sum(CASE WHEN f.status = 'blocked' THEN 1 ELSE 0 END) as blocked,
-                     sum(CASE WHEN f.status = 'complete' THEN 1 ELSE 0 END) as complete
-                RETURN total, pending, in_progress, blocked, complete
-                """,
-                path=self._project_path,
-            )
-            record = result.single()
-            if not record:
-                return ProjectStats()
-
-            total = int(record["total"] or 0)
-            complete = int(record["complete"] or 0)
-            return ProjectStats(
-                total=total,
-                pending=int(record["pending"] or 0),
-                in_progress=int(record["in_progress"] or 0),
-                blocked=int(record["blocked"] or 0),
-                complete=complete,
-                completion_percentage=round((complete / total) * 100) if total > 0 else 0,
-            )
+        records = self.run_read(
+            _CYPHER_GET_STATS,
+            path=self._project_path,
+        )
+        return _project_stats({record["status"]: record["count"] for record in records})
+
+    def dashboard_snapshot(self, include_features: bool = True) -> dict:
+        """
+        Fetch everything a status dashboard shows in one go.
+
+        The reads are independent, so they run concurrently on separate
+        pooled sessions and the call costs roughly the slowest query.
+
+        Args:
+            include_features: Also list the project's features
+
+        Returns:
+            Dict with: project, stats, active_feature, active_session, features
+        """
+        calls = {
+            "project": self.get_project,
+            "stats": self.get_stats,
+            "active_feature": self.get_active_feature,
+            "active_session": self.get_active_session,
+        }
+        if include_features:
+            calls["features"] = self.list_features
+
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = {key: pool.submit(fn) for key, fn in calls.items()}
+            snapshot = {key: future.result() for key, future in futures.items()}
+
+        snapshot.setdefault("features", None)
+        if snapshot["project"] is None:
+            # First visit to this project: create it once the reads are done
+            snapshot["project"] = self.ensure_project()
+        return snapshot
 
     # =========================================================================
     # INSIGHT OPERATIONS
@@ -741,46 +1300,16 @@ class IjokaClient:
         """Record a new insight."""
         insight_id = str(uuid.uuid4())
 
-        with self.session(mode="WRITE") as session:
-            result = session.run(
-                """
-                CREATE (i:Insight {
-                    id: $id,
-                    description: $description,
-                    pattern_type: $pattern_type,
-                    tags: $tags,
-                    usage_count: 0,
-                    created_at: datetime()
-                })
-                RETURN i
-                """,
-                id=insight_id,
-                description=description,
-                pattern_type=pattern_type,
-                tags=tags or [],
-            )
-            node = result.single()["i"]
-
-            # Link to feature if provided
-            if feature_id:
-                session.run(
-                    """
-                    MATCH (i:Insight {id: $insight_id})
-                    MATCH (f:Feature {id: $feature_id})
-                    MERGE (i)-[:LEARNED_FROM]->(f)
-                    """,
-                    insight_id=insight_id,
-                    feature_id=feature_id,
-                )
-
-            return Insight(
-                id=node["id"],
-                description=node["description"],
-                pattern_type=InsightType(node["pattern_type"]),
-                tags=list(node.get("tags", [])),
-                usage_count=0,
-                created_at=self._parse_datetime(node.get("created_at")),
-            )
+        records = self.run_write(
+            _CYPHER_RECORD_INSIGHT,
+            now=datetime.now(timezone.utc),
+            id=insight_id,
+            description=description,
+            pattern_type=pattern_type,
+            tags=tags or [],
+            feature_id=feature_id or "",
+        )
+        return self._node_to_insight(records[0]["i"])
 
     def list_insights(
         self,
@@ -789,54 +1318,13 @@ class IjokaClient:
         limit: int = 10,
     ) -> list[Insight]:
         """List insights with optional filtering."""
-        with self.session() as session:
-            if query:
-                result = session.run(
-                    """
-                    MATCH (i:Insight)
-                    WHERE i.description CONTAINS $query
-                    RETURN i
-                    ORDER BY i.usage_count DESC, i.created_at DESC
-                    LIMIT $limit
-                    """,
-                    query=query,
-                    limit=limit,
-                )
-            elif tags:
-                result = session.run(
-                    """
-                    MATCH (i:Insight)
-                    WHERE any(tag IN $tags WHERE tag IN i.tags)
-                    RETURN i
-                    ORDER BY i.usage_count DESC, i.created_at DESC
-                    LIMIT $limit
-                    """,
-                    tags=tags,
-                    limit=limit,
-                )
-            else:
-                result = session.run(
-                    """
-                    MATCH (i:Insight)
-                    RETURN i
-                    ORDER BY i.usage_count DESC, i.created_at DESC
-                    LIMIT $limit
-                    """,
-                    limit=limit,
-                )
-
-            insights = []
-            for record in result:
-                node = record["i"]
-                insights.append(Insight(
-                    id=node["id"],
-                    description=node["description"],
-                    pattern_type=InsightType(node["pattern_type"]),
-                    tags=list(node.get("tags", [])),
-                    usage_count=int(node.get("usage_count", 0)),
-                    created_at=self._parse_datetime(node.get("created_at")),
-                ))
-            return insights
+        records = self.run_read(
+            _CYPHER_LIST_INSIGHTS,
+            query=query or None,
+            tags=tags or None,
+            limit=limit,
+        )
+        return [self._node_to_insight(record["i"]) for record in records]
 
     # =========================================================================
     # SESSION OPERATIONS
@@ -844,29 +1332,17 @@ class IjokaClient:
 
     def get_active_session(self) -> Optional[Session]:
         """Get the active session for this project."""
-        with self.session() as db_session:
-            result = db_session.run(
-                """
-                MATCH (s:Session {status: 'active'})-[:IN_PROJECT]->(p:Project {path: $path})
-                RETURN s
-                ORDER BY s.last_activity DESC
-                LIMIT 1
-                """,
+        def _tx(tx):
+            return tx.run(
+                _CYPHER_GET_ACTIVE_SESSION,
                 path=self._project_path,
-            )
-            record = result.single()
+            ).single(strict=False)
+
+        with self.session(fetch_size=1) as db_session:
+            record = db_session.execute_read(_tx)
             if not record:
                 return None
-            node = record["s"]
-            return Session(
-                id=node["id"],
-                agent=node["agent"],
-                status=node["status"],
-                started_at=self._parse_datetime(node.get("started_at")),
-                last_activity=self._parse_datetime(node.get("last_activity")),
-                event_count=int(node.get("event_count", 0)),
-                is_subagent=bool(node.get("is_subagent", False)),
-            )
+            return self._record_to_session(record)
 
     # =========================================================================
     # PLAN OPERATIONS
@@ -883,49 +1359,51 @@ class IjokaClient:
         Returns:
             List of created Step models
         """
-        with self.session(mode="WRITE") as session:
+        rows = [
+            {"id": str(uuid.uuid4()), "description": description, "step_order": idx}
+            for idx, description in enumerate(steps)
+        ]
+
+        # Replace the plan in one transaction
+        def _tx(tx):
             # Delete existing steps first
-            session.run(
-                "MATCH (s:Step)-[:BELONGS_TO]->(f:Feature {id: $id}) DETACH DELETE s",
+            tx.run(
+                _CYPHER_DELETE_STEPS,
                 id=feature_id,
             )
 
-            # Create new steps
-            created_steps = []
-            for idx, description in enumerate(steps):
-                step_id = str(uuid.uuid4())
-                result = session.run(
-                    """
-                    MATCH (f:Feature {id: $feature_id})
-                    CREATE (s:Step {
-                        id: $id,
-                        feature_id: $feature_id,
-                        description: $description,
-                        status: 'pending',
-                        step_order: $step_order,
-                        created_at: datetime(),
-                        updated_at: datetime()
-                    })-[:BELONGS_TO]->(f)
-                    RETURN s
-                    """,
-                    id=step_id,
-                    feature_id=feature_id,
-                    description=description,
-                    step_order=idx,
-                )
-                node = result.single()["s"]
-                created_steps.append(Step(
-                    id=node["id"],
-                    feature_id=node["feature_id"],
-                    description=node["description"],
-                    status=StepStatus(node["status"]),
-                    step_order=int(node["step_order"]),
-                    created_at=self._parse_datetime(node.get("created_at")),
-                    updated_at=self._parse_datetime(node.get("updated_at")),
-                ))
-
-            return created_steps
+            # Create all steps in one round trip
+            return list(tx.run(
+                _CYPHER_CREATE_STEPS,
+                now=datetime.now(timezone.utc),
+                feature_id=feature_id,
+                rows=rows,
+            ))
 
+        with self.session(mode="WRITE") as session:
+            records = session.execute_write(_tx)
+
+        return self._created_steps(records, feature_id, rows)
+
+    def _created_steps(self, records: list, feature_id: str, rows: list[dict]) -> list[Step]:
+        """Steps returned by _CYPHER_CREATE_STEPS (a missing feature creates none)."""
+        created_steps = []
+        for record in records:
+            d = dict(record["s"])
+            created_steps.append(Step.model_construct(
+                id=d["id"],
+                feature_id=d["feature_id"],
+                description=d["description"],
+                status=STEP_STATUS_BY_VALUE[d["status"]],
+                step_order=int(d["step_order"]),
+                created_at=self._parse_datetime(d.get("created_at")),
+            ))
+
+        if rows and not created_steps:
+            raise ValueError(f"Feature not found: {feature_id}")
+        return created_steps
+
+    @_cached
     def get_plan(self, feature_id: Optional[str] = None) -> dict:
         """
         Get plan steps with progress.
@@ -934,7 +1412,7 @@ class IjokaClient:
             feature_id: Feature ID (uses active feature if not provided)
 
         Returns:
-            Dict with: feature_id, steps, active_step, progress
+            Dict with: feature_id, steps, active_step, by_status, progress
         """
         if not feature_id:
             active_feature = self.get_active_feature()
@@ -942,52 +1420,69 @@ class IjokaClient:
                 raise ValueError("No active feature to get plan for")
             feature_id = active_feature.id
 
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (s:Step)-[:BELONGS_TO]->(f:Feature {id: $id})
-                RETURN s
-                ORDER BY s.step_order ASC
-                """,
+        def _tx(tx):
+            return list(tx.run(
+                _CYPHER_GET_PLAN,
                 id=feature_id,
-            )
+            ))
 
-            steps = []
-            active_step = None
-            completed_count = 0
-
-            for record in result:
-                node = record["s"]
-                step = Step(
-                    id=node["id"],
-                    feature_id=feature_id,  # Use param, not node (relationship-derived)
-                    description=node["description"],
-                    status=StepStatus(node["status"]),
-                    step_order=int(node["step_order"]),
-                    created_at=self._parse_datetime(node.get("created_at")),
-                    updated_at=self._parse_datetime(node.get("updated_at")),
-                    completed_at=self._parse_datetime(node.get("completed_at")),
-                )
-                steps.append(step)
+        # Pull the whole plan in one batch rather than paging
+        with self.session(fetch_size=1000) as session:
+            records = session.execute_read(_tx)
 
-                if step.status == StepStatus.IN_PROGRESS:
-                    active_step = step
-                elif step.status == StepStatus.COMPLETED:
-                    completed_count += 1
+        return self._plan_from_records(records, feature_id)
 
-            total = len(steps)
-            percentage = round((completed_count / total) * 100) if total > 0 else 0
+    def _plan_from_records(self, records: list, feature_id: str) -> dict:
+        """Build the get_plan result from _CYPHER_GET_PLAN rows."""
+        steps = []
+        # Bucket once so callers can pick steps by status without rescanning
+        by_status: dict[StepStatus, list[Step]] = {status: [] for status in StepStatus}
 
-            return {
-                "feature_id": feature_id,
-                "steps": steps,
-                "active_step": active_step,
-                "progress": {
-                    "completed": completed_count,
-                    "total": total,
-                    "percentage": percentage,
-                }
+        for record in records:
+            # Use param, not node (relationship-derived)
+            step = self._record_to_step(record, feature_id)
+            steps.append(step)
+            by_status[step.status].append(step)
+
+        in_progress = by_status[StepStatus.IN_PROGRESS]
+        active_step = in_progress[-1] if in_progress else None
+        completed_count = len(by_status[StepStatus.COMPLETED])
+        total = len(steps)
+        percentage = round((completed_count / total) * 100) if total > 0 else 0
+
+        return {
+            "feature_id": feature_id,
+            "steps": steps,
+            "active_step": active_step,
+            "by_status": by_status,
+            "progress": {
+                "completed": completed_count,
+                "total": total,
+                "percentage": percentage,
             }
+        }
+
+    @_cached
+    def get_plan_progress(self, feature_id: str) -> dict:
+        """
+        Get plan progress counts without fetching the steps.
+
+        Args:
+            feature_id: Feature ID
+
+        Returns:
+            Dict with: completed, total, percentage
+        """
+        def _tx(tx):
+            return tx.run(
+                _CYPHER_GET_PLAN_PROGRESS,
+                id=feature_id,
+            ).single(strict=False)
+
+        with self.session(fetch_size=1) as session:
+            record = session.execute_read(_tx)
+
+        return _plan_progress(record)
 
     def get_active_step(self, feature_id: str) -> Optional[Step]:
         """
@@ -999,30 +1494,19 @@ class IjokaClient:
         Returns:
             The active step or None
         """
-        with self.session() as session:
-            result = session.run(
-                """
-                MATCH (s:Step {status: 'in_progress'})-[:BELONGS_TO]->(f:Feature {id: $id})
-                RETURN s
-                LIMIT 1
-                """,
+        def _tx(tx):
+            return tx.run(
+                _CYPHER_GET_ACTIVE_STEP,
                 id=feature_id,
-            )
-            record = result.single()
+            ).single(strict=False)
+
+        with self.session(fetch_size=1) as session:
+            record = session.execute_read(_tx)
             if not record:
                 return None
 
-            node = record["s"]
-            return Step(
-                id=node["id"],
-                feature_id=feature_id,  # Use param, not node (relationship-derived)
-                description=node["description"],
-                status=StepStatus(node["status"]),
-                step_order=int(node["step_order"]),
-                created_at=self._parse_datetime(node.get("created_at")),
-                updated_at=self._parse_datetime(node.get("updated_at")),
-                completed_at=self._parse_datetime(node.get("completed_at")),
-            )
+            # Use param, not node (relationship-derived)
+            return self._record_to_step(record, feature_id)
 
     def update_step_status(self, step_id: str, status: str) -> Step:
         """
@@ -1035,39 +1519,18 @@ class IjokaClient:
         Returns:
             Updated Step
         """
-        with self.session(mode="WRITE") as session:
-            # Build SET clause based on status
-            set_clause = "s.status = $status, s.updated_at = datetime()"
-            if status in ("complete", "completed"):
-                set_clause += ", s.completed_at = datetime()"
-
-            result = session.run(
-                f"""
-                MATCH (s:Step {{id: $id}})
-                OPTIONAL MATCH (s)-[:BELONGS_TO]->(f:Feature)
-                SET {set_clause}
-                RETURN s, f.id as feature_id
-                """,
-                id=step_id,
-                status=status,
-            )
-            record = result.single()
-            if not record:
-                raise ValueError(f"Step not found: {step_id}")
+        records = self.run_write(
+            _CYPHER_UPDATE_STEP_STATUS,
+            now=datetime.now(timezone.utc),
+            id=step_id,
+            status=status,
+        )
+        record = records[0] if records else None
+        if not record:
+            raise ValueError(f"Step not found: {step_id}")
 
-            node = record["s"]
-            # Get feature_id from relationship or node property
-            feature_id = record.get("feature_id") or node.get("feature_id") or ""
-            return Step(
-                id=node["id"],
-                feature_id=feature_id,
-                description=node["description"],
-                status=StepStatus(node["status"]),
-                step_order=int(node.get("step_order", 0)),
-                created_at=self._parse_datetime(node.get("created_at")),
-                updated_at=self._parse_datetime(node.get("updated_at")),
-                completed_at=self._parse_datetime(node.get("completed_at")),
-            )
+        # feature_id comes from the relationship, falling back to the node property
+        return self._record_to_step(record, record["feature_id"] or "")
 
     def checkpoint(
         self,
@@ -1086,55 +1549,43 @@ class IjokaClient:
         Returns:
             Dict with warnings list if drift detected
         """
-        warnings = []
-
-        if feature_id:
-            active_feature = self.get_feature(feature_id)
-        else:
-            active_feature = self.get_active_feature()
-
-        if not active_feature:
-            warnings.append("No active feature - checkpoint ignored")
-            return {"warnings": warnings}
+        with self.shared_session():
+            warnings = []
 
-        active_step = self.get_active_step(active_feature.id)
-
-        # Handle step completion
-        if step_completed and active_step:
-            # Simple matching: check if step_completed is in active step description
-            if step_completed.lower() in active_step.description.lower():
-                # Mark current step complete
-                self.update_step_status(active_step.id, "complete")
+            if feature_id:
+                active_feature = self.get_feature(feature_id)
+            else:
+                active_feature = self.get_active_feature()
 
-                # Start next step if available
-                plan = self.get_plan(active_feature.id)
-                next_pending = next(
-                    (s for s in plan["steps"] if s.status == StepStatus.PENDING),
-                    None
+            if not active_feature:
+                warnings.append("No active feature - checkpoint ignored")
+                return {"warnings": warnings}
+
+            # Heartbeat checkpoints carry nothing to check against the plan
+            if not step_completed and not current_activity:
+                return {"warnings": warnings}
+
+            if step_completed:
+                # Match, complete and advance the active step server-side;
+                # the returned step is the one that was active on entry
+                records = self.run_write(
+                    _CYPHER_CHECKPOINT_STEP,
+                    now=datetime.now(timezone.utc),
+                    id=active_feature.id,
+                    completed=step_completed,
                 )
-                if next_pending:
-                    self.update_step_status(next_pending.id, "in_progress")
-
-        # Simple drift detection
-        if current_activity and active_step:
-            # Extract keywords from both (simple word-based overlap check)
-            activity_words = set(current_activity.lower().split())
-            step_words = set(active_step.description.lower().split())
-
-            # Remove common words
-            common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"}
-            activity_words -= common_words
-            step_words -= common_words
-
-            # Check for overlap
-            overlap = activity_words & step_words
-            if not overlap and len(activity_words) > 0 and len(step_words) > 0:
-                warnings.append(
-                    f"Potential drift: working on '{current_activity}' "
-                    f"but active step is '{active_step.description}'"
+                active_step = (
+                    self._record_to_step(records[0], active_feature.id) if records else None
                 )
+            else:
+                active_step = self.get_active_step(active_feature.id)
 
-        return {"warnings": warnings}
+            # Simple drift detection
+            drift = _drift_warning(current_activity, active_step)
+            if drift:
+                warnings.append(drift)
+
+            return {"warnings": warnings}
 
     def discover_feature(
         self,
@@ -1160,29 +1611,35 @@ class IjokaClient:
         Returns:
             Dict with feature and stats (reattributed_count currently always 0)
         """
-        # Create the feature
-        feature = self.create_feature(
-            description=description,
-            category=category,
-            priority=priority,
-            steps=steps or [],
-            work_item_type=work_item_type,
-        )
+        steps = steps or []
+        step_rows = [
+            {"id": str(uuid.uuid4()), "description": step, "step_order": idx}
+            for idx, step in enumerate(steps)
+        ]
+
+        # Create, plan and start/complete in a single write transaction
+        def _tx(tx):
+            return tx.run(
+                _CYPHER_DISCOVER_FEATURE,
+                now=datetime.now(timezone.utc),
+                path=self._project_path,
+                project_id=str(uuid.uuid4()),
+                project_name=os.path.basename(self._project_path),
+                id=str(uuid.uuid4()),
+                description=description,
+                category=category,
+                type=work_item_type,
+                priority=priority,
+                steps=steps,
+                step_rows=step_rows,
+                mark_complete=mark_complete,
+                agent="cli",
+                session_id=f"cli-{int(datetime.now().timestamp())}",
+            ).single()
 
-        # Create plan steps if provided
-        if steps:
-            self.set_plan(feature.id, steps)
-
-        # Either complete or start the feature
-        if mark_complete:
-            feature = self.complete_feature(feature.id)
-        else:
-            feature = self.start_feature(feature.id)
-            # If we have steps and we started the feature, activate first step
-            if steps:
-                plan = self.get_plan(feature.id)
-                if plan["steps"]:
-                    self.update_step_status(plan["steps"][0].id, "in_progress")
+        with self.session(mode="WRITE") as session:
+            record = session.execute_write(_tx)
+            feature = self._node_to_feature(record["f"])
 
         return {
             "feature": feature,
@@ -1195,38 +1652,147 @@ class IjokaClient:
 
     def _node_to_feature(self, node) -> Feature:
         """Convert a neo4j node to a Feature model."""
-        return Feature(
-            id=node["id"],
-            description=node["description"],
-            category=FeatureCategory(node["category"]),
-            type=WorkItemType(node.get("type", "feature")),
-            status=FeatureStatus(node["status"]),
-            priority=int(node.get("priority", 0)),
-            is_primary=bool(node.get("is_primary", False)),
-            steps=list(node.get("steps", [])),
-            work_count=int(node.get("work_count", 0)),
-            assigned_agent=node.get("assigned_agent"),
-            claiming_session_id=node.get("claiming_session_id"),
-            claiming_agent=node.get("claiming_agent"),
-            claimed_at=self._parse_datetime(node.get("claimed_at")),
-            block_reason=node.get("block_reason"),
-            parent_id=node.get("parent_id"),
-            branch_hint=node.get("branch_hint"),
-            file_patterns=list(node.get("file_patterns", [])),
-            created_at=self._parse_datetime(node.get("created_at")),
-            updated_at=self._parse_datetime(node.get("updated_at")),
-            completed_at=self._parse_datetime(node.get("completed_at")),
+        # Snapshot the properties once, then read from the plain dict.
+        # Trusted DB data: skip validation, the fields are coerced here.
+        d = dict(node)
+        get = d.get
+        parse = self._parse_datetime
+        return Feature.model_construct(
+            id=d["id"],
+            description=d["description"],
+            category=FEATURE_CATEGORY_BY_VALUE[d["category"]],
+            type=WORK_ITEM_TYPE_BY_VALUE[get("type", "feature")],
+            status=FEATURE_STATUS_BY_VALUE[d["status"]],
+            priority=int(get("priority", 0)),
+            is_primary=bool(get("is_primary", False)),
+            steps=get("steps") or (),
+            work_count=int(get("work_count", 0)),
+            assigned_agent=_intern(get("assigned_agent")),
+            claiming_session_id=get("claiming_session_id"),
+            claiming_agent=_intern(get("claiming_agent")),
+            claimed_at=parse(get("claimed_at")),
+            block_reason=get("block_reason"),
+            parent_id=get("parent_id"),
+            branch_hint=_intern(get("branch_hint")),
+            file_patterns=get("file_patterns") or (),
+            created_at=parse(get("created_at")),
+            updated_at=parse(get("updated_at")),
+            completed_at=parse(get("completed_at")),
+        )
+
+    def _record_to_feature(self, record) -> Feature:
+        """
+        Convert a record projected with _feature_projection to a Feature.
+
+        Straight-line unpacking in Feature field order; a field added to the
+        model without a matching conversion here fails loudly on unpack.
+        """
+        (
+            id_, description, category, type_, status, priority, is_primary,
+            steps, work_count, assigned_agent, claiming_session_id, claiming_agent,
+            claimed_at, block_reason, parent_id, branch_hint, file_patterns,
+            created_at, updated_at, completed_at,
+        ) = record.values()
+        parse = self._parse_datetime
+        return Feature.model_construct(
+            id=id_,
+            description=description,
+            category=FEATURE_CATEGORY_BY_VALUE[category],
+            type=WORK_ITEM_TYPE_BY_VALUE[type_ or "feature"],
+            status=FEATURE_STATUS_BY_VALUE[status],
+            priority=int(priority or 0),
+            is_primary=bool(is_primary),
+            steps=steps or (),
+            work_count=int(work_count or 0),
+            assigned_agent=_intern(assigned_agent),
+            claiming_session_id=claiming_session_id,
+            claiming_agent=_intern(claiming_agent),
+            claimed_at=parse(claimed_at),
+            block_reason=block_reason,
+            parent_id=parent_id,
+            branch_hint=_intern(branch_hint),
+            file_patterns=file_patterns or (),
+            created_at=parse(created_at),
+            updated_at=parse(updated_at),
+            completed_at=parse(completed_at),
+        )
+
+    def _record_to_list_item(self, record) -> FeatureListItem:
+        """Convert a _CYPHER_LIST_FEATURES row to a compact FeatureListItem."""
+        (
+            id_, description, category, type_, status, priority, is_primary,
+            work_count, assigned_agent,
+        ) = record.values()
+        return FeatureListItem(
+            id=id_,
+            description=description,
+            category=FEATURE_CATEGORY_BY_VALUE[category],
+            type=WORK_ITEM_TYPE_BY_VALUE[type_ or "feature"],
+            status=FEATURE_STATUS_BY_VALUE[status],
+            priority=int(priority or 0),
+            is_primary=bool(is_primary),
+            work_count=int(work_count or 0),
+            assigned_agent=_intern(assigned_agent),
+        )
+
+    def _node_to_project(self, node) -> Project:
+        """Convert a neo4j node to a Project model."""
+        d = dict(node)
+        get = d.get
+        return Project.model_construct(
+            id=d["id"],
+            path=d["path"],
+            name=d["name"],
+            description=get("description"),
+            created_at=self._parse_datetime(get("created_at")),
+            updated_at=self._parse_datetime(get("updated_at")),
+        )
+
+    def _record_to_session(self, record) -> Session:
+        """Convert a session row to a Session model."""
+        return Session.model_construct(
+            id=record["id"],
+            agent=record["agent"],
+            status=SESSION_STATUS_BY_VALUE[record["status"]],
+            started_at=self._parse_datetime(record["started_at"]),
+            last_activity=self._parse_datetime(record["last_activity"]),
+            event_count=int(record["event_count"] or 0),
+            is_subagent=bool(record["is_subagent"]),
+        )
+
+    def _node_to_insight(self, node) -> Insight:
+        """Convert a neo4j node to an Insight model."""
+        d = dict(node)
+        get = d.get
+        return Insight.model_construct(
+            id=d["id"],
+            description=d["description"],
+            pattern_type=INSIGHT_TYPE_BY_VALUE[d["pattern_type"]],
+            tags=get("tags") or (),
+            usage_count=int(get("usage_count", 0)),
+            created_at=self._parse_datetime(get("created_at")),
+        )
+
+    def _record_to_step(self, record, feature_id: str) -> Step:
+        """Convert a projected step record to a Step model."""
+        return Step.model_construct(
+            id=record["id"],
+            feature_id=feature_id,
+            description=record["description"],
+            status=STEP_STATUS_BY_VALUE[record["status"]],
+            step_order=int(record["step_order"] or 0),
+            created_at=self._parse_datetime(record["created_at"]),
+            completed_at=self._parse_datetime(record["completed_at"]),
         )
 
     def _parse_datetime(self, value) -> Optional[datetime]:
         """Parse datetime from neo4j."""
-        if value is None:
-            return None
-        if isinstance(value, datetime):
+        if value is None or isinstance(value, datetime):
             return value
-        if hasattr(value, "to_native"):
-            return value.to_native()
-        return None
+        try:
+            return _to_native_datetime(value)
+        except TypeError:  # unhashable
+            return None
 
 
 # =============================================================================
@@ -1235,12 +1801,12 @@ class IjokaClient:
 
 # Type priority weights for attribution (higher = more likely to get events)
 TYPE_PRIORITY = {
-    "hotfix": 1.0,   # Urgent - always gets attribution
-    "bug": 0.8,      # Important fixes
-    "feature": 0.6,  # Standard development
-    "spike": 0.4,    # Research - less likely to have specific files
-    "chore": 0.3,    # Maintenance
-    "epic": 0.2,     # Container - usually delegates to children
+    WorkItemType.HOTFIX: 1.0,   # Urgent - always gets attribution
+    WorkItemType.BUG: 0.8,      # Important fixes
+    WorkItemType.FEATURE: 0.6,  # Standard development
+    WorkItemType.SPIKE: 0.4,    # Research - less likely to have specific files
+    WorkItemType.CHORE: 0.3,    # Maintenance
+    WorkItemType.EPIC: 0.2,     # Container - usually delegates to children
 }
 
 
@@ -1333,7 +1899,7 @@ def score_attribution(
                 reasons.append(f"keywords:{overlap}/{total}")
 
         # 3. Type priority (0.2 weight)
-        type_weight = TYPE_PRIORITY.get(feature.type.value, 0.5)
+        type_weight = TYPE_PRIORITY.get(feature.type, 0.5)
         score += type_weight * 0.2
 
         # 4. Primary bonus (0.1)
@@ -1354,7 +1920,18 @@ def score_attribution(
 
 
 # Convenience function for quick access
+@functools.lru_cache(maxsize=8)
+def _cached_client(uri: str, project_path: str) -> IjokaClient:
+    """One long-lived client per (uri, project) so callers share its read cache."""
+    return IjokaClient(uri=uri, project_path=project_path)
+
+
 def get_client(project_path: Optional[str] = None) -> IjokaClient:
-    """Get an Ijoka client instance."""
+    """Get the shared Ijoka client for a project (current project by default)."""
     uri = os.environ.get("IJOKA_DB_URI", "bolt://localhost:7687")
-    return IjokaClient(uri=uri, project_path=project_path)
+    project_path = (
+        project_path
+        or os.environ.get("IJOKA_PROJECT_PATH")
+        or _detect_git_root(os.getcwd())
+    )
+    return _cached_client(uri, project_path)
@@ -2,11 +2,14 @@
 Pydantic models for Ijoka domain objects.
 
 These models provide validation, serialization, and rich repr support.
+Output-only models built from database rows (list items, analytics results)
+are slotted dataclasses instead; pydantic response models accept them as fields.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +22,9 @@ class FeatureStatus(str, Enum):
     COMPLETE = "complete"
 
 
+FEATURE_STATUS_BY_VALUE: dict[str, FeatureStatus] = {m.value: m for m in FeatureStatus}
+
+
 class FeatureCategory(str, Enum):
     """Feature categories for classification."""
     FUNCTIONAL = "functional"
@@ -34,6 +40,9 @@ class FeatureCategory(str, Enum):
     ENHANCEMENT = "enhancement"
 
 
+FEATURE_CATEGORY_BY_VALUE: dict[str, FeatureCategory] = {m.value: m for m in FeatureCategory}
+
+
 class WorkItemType(str, Enum):
     """Work item types for feature classification."""
     FEATURE = "feature"      # New functionality
@@ -44,6 +53,9 @@ class WorkItemType(str, Enum):
     EPIC = "epic"            # Large initiative spanning multiple features
 
 
+WORK_ITEM_TYPE_BY_VALUE: dict[str, WorkItemType] = {m.value: m for m in WorkItemType}
+
+
 class InsightType(str, Enum):
     """Types of insights that can be recorded."""
     SOLUTION = "solution"
@@ -52,6 +64,9 @@ class InsightType(str, Enum):
     TOOL_USAGE = "tool_usage"
 
 
+INSIGHT_TYPE_BY_VALUE: dict[str, InsightType] = {m.value: m for m in InsightType}
+
+
 class StepStatus(str, Enum):
     """Plan step status."""
     PENDING = "pending"
@@ -60,6 +75,9 @@ class StepStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+STEP_STATUS_BY_VALUE: dict[str, StepStatus] = {m.value: m for m in StepStatus}
+
+
 class SessionStatus(str, Enum):
     """Agent session status."""
     ACTIVE = "active"
@@ -67,6 +85,9 @@ class SessionStatus(str, Enum):
     STALE = "stale"
 
 
+SESSION_STATUS_BY_VALUE: dict[str, SessionStatus] = {m.value: m for m in SessionStatus}
+
+
 # =============================================================================
 # DOMAIN MODELS
 # =============================================================================
@@ -91,7 +112,7 @@ class Feature(BaseModel):
     status: FeatureStatus = FeatureStatus.PENDING
     priority: int = Field(default=50, ge=-100, le=100)
     is_primary: bool = Field(default=False)  # Primary focus for event attribution
-    steps: list[str] = Field(default_factory=list)
+    steps: Sequence[str] = ()
     work_count: int = Field(default=0, ge=0)
 
     # Assignment
@@ -108,7 +129,7 @@ class Feature(BaseModel):
 
     # Branch affinity
     branch_hint: Optional[str] = None
-    file_patterns: list[str] = Field(default_factory=list)
+    file_patterns: Sequence[str] = ()
 
     # Timestamps
     created_at: Optional[datetime] = None
@@ -116,14 +137,25 @@ class Feature(BaseModel):
     completed_at: Optional[datetime] = None
 
 
-class FeatureListItem(BaseModel):
-    """Compact feature representation for list views."""
+def _check_range(model: str, name: str, value, ge=None, le=None) -> None:
+    """Raise ValueError if a dataclass field is outside [ge, le] (None skips a bound)."""
+    if value is None:
+        return
+    if ge is not None and value < ge:
+        raise ValueError(f"{model}.{name} must be >= {ge}, got {value!r}")
+    if le is not None and value > le:
+        raise ValueError(f"{model}.{name} must be <= {le}, got {value!r}")
+
+
+@dataclass(slots=True)
+class FeatureListItem:
+    """Compact feature representation for list views (built from DB rows, not validated)."""
     id: str
     description: str
     category: FeatureCategory
-    type: WorkItemType = WorkItemType.FEATURE
     status: FeatureStatus
     priority: int
+    type: WorkItemType = WorkItemType.FEATURE
     is_primary: bool = False
     work_count: int = 0
     assigned_agent: Optional[str] = None
@@ -147,7 +179,7 @@ class Insight(BaseModel):
     id: str
     description: str
     pattern_type: InsightType
-    tags: list[str] = Field(default_factory=list)
+    tags: Sequence[str] = ()
     usage_count: int = Field(default=0, ge=0)
     effectiveness_score: Optional[float] = Field(default=None, ge=0, le=1)
     created_at: Optional[datetime] = None
@@ -249,35 +281,48 @@ class VelocityTrend(str, Enum):
     DECLINING = "declining"
 
 
-class FeatureCluster(BaseModel):
+@dataclass(slots=True)
+class FeatureCluster:
     """Group of related features identified by pattern analysis."""
     id: str
     name: str
-    feature_ids: list[str] = Field(default_factory=list)
+    feature_ids: list[str] = field(default_factory=list)
     common_category: Optional[FeatureCategory] = None
     avg_completion_time: Optional[float] = None  # hours
-    size: int = Field(default=0, ge=0)
+    size: int = 0
 
+    def __post_init__(self) -> None:
+        _check_range("FeatureCluster", "size", self.size, ge=0)
 
-class WorkflowPattern(BaseModel):
+
+@dataclass(slots=True)
+class WorkflowPattern:
     """Recurring workflow sequence detected across features."""
     id: str
-    sequence: list[str] = Field(default_factory=list)  # step types or tool names
-    frequency: int = Field(default=1, ge=1)
+    sequence: list[str] = field(default_factory=list)  # step types or tool names
+    frequency: int = 1
     avg_duration: Optional[float] = None  # hours
-    success_rate: Optional[float] = Field(default=None, ge=0, le=1)
+    success_rate: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        _check_range("WorkflowPattern", "frequency", self.frequency, ge=1)
+        _check_range("WorkflowPattern", "success_rate", self.success_rate, ge=0, le=1)
 
 
-class Bottleneck(BaseModel):
+@dataclass(slots=True)
+class Bottleneck:
     """Identified bottleneck in workflow."""
     id: str
     feature_id: str
     description: Optional[str] = None
     severity: BottleneckSeverity = BottleneckSeverity.MEDIUM
     avg_block_duration: Optional[float] = None  # hours
-    occurrences: int = Field(default=1, ge=1)
+    occurrences: int = 1
     block_reason: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        _check_range("Bottleneck", "occurrences", self.occurrences, ge=1)
+
 
 class AgentProfile(BaseModel):
     """Behavioral profile for an AI agent."""
@@ -291,16 +336,21 @@ class AgentProfile(BaseModel):
     active_hours: Optional[dict[str, int]] = None  # hour -> count
 
 
-class VelocityMetrics(BaseModel):
+@dataclass(slots=True)
+class VelocityMetrics:
     """Productivity velocity over a time period."""
     period_start: datetime
     period_end: datetime
-    features_completed: int = Field(default=0, ge=0)
-    features_started: int = Field(default=0, ge=0)
+    features_completed: int = 0
+    features_started: int = 0
     avg_cycle_time: Optional[float] = None  # hours from start to complete
     trend: VelocityTrend = VelocityTrend.STABLE
     features_per_day: Optional[float] = None
 
+    def __post_init__(self) -> None:
+        _check_range("VelocityMetrics", "features_completed", self.features_completed, ge=0)
+        _check_range("VelocityMetrics", "features_started", self.features_started, ge=0)
+
 
 class AnalyticsInsightType(str, Enum):
     """Types of analytics insights."""
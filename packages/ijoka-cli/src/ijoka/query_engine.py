@@ -5,54 +5,157 @@ Classifies user queries and routes them to appropriate analytics modules.
 """
 
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import cached_property
 from typing import Optional
 
 from loguru import logger
 
 from .analytics import InsightSynthesizer, PatternDetector, TemporalAnalyzer, AgentProfiler
-from .models import AnalyticsQueryResponse, AnalyticsInsight
+from .models import AnalyticsQueryResponse, AnalyticsInsight, BottleneckSeverity
+
+
+_WORD_RE = re.compile(r"\w+")
+
+# Velocity time windows mentioned in a query, in order of precedence
+_WINDOW_RE = re.compile(r"(?P<month>month)|(?P<fortnight>two weeks|2 weeks)|(?P<today>today)")
+_WINDOW_DAYS = (("month", 30), ("fortnight", 14), ("today", 1))
+
+# Common agent names, in order of precedence
+_KNOWN_AGENTS = ("claude-code", "claude", "codex", "gemini", "cursor")
+_AGENT_RE = re.compile("|".join(re.escape(agent) for agent in _KNOWN_AGENTS))
+# "my" as a space-delimited word implies the current user's agent
+_MY_RE = re.compile(r"(?<![^ ])my(?![^ ])")
+
+# Bottleneck severities reported as high-impact insights
+_HIGH_SEVERITY = frozenset({BottleneckSeverity.CRITICAL, BottleneckSeverity.HIGH})
+
+
+def _dict_without_none(items: list[tuple[str, object]]) -> dict:
+    """asdict() factory that leaves out unset (None) fields."""
+    return {key: value for key, value in items if value is not None}
+
+
+def _union(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile patterns into one case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
 
 
 class AgenticQueryEngine:
     """Natural language to analytics query engine."""
 
-    # Query classification patterns
-    VELOCITY_PATTERNS = [
-        r"\b(velocity|speed|productivity|fast|slow|throughput|rate)\b",
+    # Query classification: a category matches on any of its keywords (a
+    # token-set lookup) or, failing that, on one of its multi-word phrases.
+    # Categories are checked in order, so earlier ones win ties.
+    VELOCITY_KEYWORDS = frozenset({
+        "velocity", "speed", "productivity", "fast", "slow", "throughput", "rate",
+    })
+    VELOCITY_PATTERNS = (
         r"\b(how many|count).*(complete|finish|done)\b",
         r"\b(features?\s+per\s+(day|week))\b",
-    ]
+    )
 
-    BOTTLENECK_PATTERNS = [
-        r"\b(block|stuck|bottleneck|problem|issue|delay)\b",
+    BOTTLENECK_KEYWORDS = frozenset({
+        "block", "stuck", "bottleneck", "problem", "issue", "delay",
+    })
+    BOTTLENECK_PATTERNS = (
         r"\b(why.*(slow|stuck|blocked))\b",
         r"\b(what.*blocking)\b",
-    ]
+    )
 
-    PROFILE_PATTERNS = [
-        r"\b(profile|agent|who|performance|team)\b",
+    PROFILE_KEYWORDS = frozenset({"profile", "agent", "who", "performance", "team"})
+    PROFILE_PATTERNS = (
         r"\b(best|top).*(agent|developer)\b",
         r"\b(my|agent).*(stats|statistics|performance)\b",
-    ]
+    )
 
-    PATTERN_PATTERNS = [
-        r"\b(pattern|workflow|sequence|common|typical)\b",
+    PATTERN_KEYWORDS = frozenset({
+        "pattern", "workflow", "sequence", "common", "typical",
+        "cluster", "group", "category",
+    })
+    PATTERN_PATTERNS = (
         r"\b(how.*(usually|typically|normally))\b",
-        r"\b(cluster|group|category)\b",
-    ]
+    )
+
+    # Responses kept for repeated queries
+    QUERY_CACHE_SIZE = 128
+    # Bottlenecks listed in a response (the count still covers all of them)
+    MAX_BOTTLENECKS = 50
+
+    _CLASSIFIERS = (
+        ("velocity", VELOCITY_KEYWORDS, _union(VELOCITY_PATTERNS)),
+        ("bottlenecks", BOTTLENECK_KEYWORDS, _union(BOTTLENECK_PATTERNS)),
+        ("profile", PROFILE_KEYWORDS, _union(PROFILE_PATTERNS)),
+        ("patterns", PATTERN_KEYWORDS, _union(PATTERN_PATTERNS)),
+    )
+    _ALL_KEYWORDS = VELOCITY_KEYWORDS | BOTTLENECK_KEYWORDS | PROFILE_KEYWORDS | PATTERN_KEYWORDS
+    # Literals at least one of which every phrase pattern above needs; keep
+    # in sync so queries without any of them skip the regexes entirely
+    _PHRASE_ANCHORS = ("how", "count", "per", "why", "what", "best", "top", "my", "agent")
 
     def __init__(self, client):
         """Initialize with IjokaClient instance."""
         self.client = client
-        self.synthesizer = InsightSynthesizer(client)
-        self.pattern_detector = PatternDetector(client)
-        self.temporal_analyzer = TemporalAnalyzer(client)
-        self.agent_profiler = AgentProfiler(client)
+        self._query_cache: OrderedDict[tuple, tuple[float, AnalyticsQueryResponse]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+    # Analytics modules are built on first use; a single query touches only one
+
+    @cached_property
+    def synthesizer(self) -> InsightSynthesizer:
+        return InsightSynthesizer(self.client)
+
+    @cached_property
+    def pattern_detector(self) -> PatternDetector:
+        return PatternDetector(self.client)
+
+    @cached_property
+    def temporal_analyzer(self) -> TemporalAnalyzer:
+        return TemporalAnalyzer(self.client)
+
+    @cached_property
+    def agent_profiler(self) -> AgentProfiler:
+        return AgentProfiler(self.client)
 
     def query(self, natural_language: str) -> AnalyticsQueryResponse:
-        """Execute a natural language query and return structured results."""
+        """
+        Execute a natural language query and return structured results.
+
+        Successful responses are reused for repeats of the same query for the
+        client's ``read_cache_ttl`` seconds, or until it writes to the graph.
+        Callers get their own copy, so changing a response never alters the
+        cached one.
+        """
         query_lower = natural_language.lower().strip()
-
+        ttl = self.client._config.read_cache_ttl
+        if ttl <= 0:
+            return self._run_query(natural_language, query_lower)
+
+        # The time window and other parameters are parsed from the query text
+        key = (query_lower, self.client.data_version)
+        now = time.monotonic()
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._query_cache.move_to_end(key)
+                return entry[1].model_copy(deep=True)
+
+        response = self._run_query(natural_language, query_lower)
+        if response.success:
+            cached = response.model_copy(deep=True)
+            with self._query_cache_lock:
+                self._query_cache[key] = (now + ttl, cached)
+                self._query_cache.move_to_end(key)
+                while len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return response
+
+    def _run_query(self, natural_language: str, query_lower: str) -> AnalyticsQueryResponse:
+        """Classify and execute a query without consulting the cache."""
         # Classify the query
         query_type = self._classify_query(query_lower)
         logger.info(f"Query classified as: {query_type}")
@@ -77,36 +180,23 @@ class AgenticQueryEngine:
             )
 
     def _classify_query(self, text: str) -> str:
-        """Classify query intent based on patterns."""
-        # Check each category
-        for pattern in self.VELOCITY_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "velocity"
-
-        for pattern in self.BOTTLENECK_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "bottlenecks"
-
-        for pattern in self.PROFILE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "profile"
-
-        for pattern in self.PATTERN_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "patterns"
-
+        """Classify query intent based on keywords and phrase patterns."""
+        lowered = text.lower()
+        tokens = frozenset(_WORD_RE.findall(lowered))
+        if tokens.isdisjoint(self._ALL_KEYWORDS) and not any(
+            anchor in lowered for anchor in self._PHRASE_ANCHORS
+        ):
+            return "general"
+        for query_type, keywords, phrases in self._CLASSIFIERS:
+            if not tokens.isdisjoint(keywords) or phrases.search(text):
+                return query_type
         return "general"
 
     def _handle_velocity_query(self, query: str) -> AnalyticsQueryResponse:
         """Handle velocity-related queries."""
-        # Extract time window if specified
-        window_days = 7
-        if "month" in query:
-            window_days = 30
-        elif "two weeks" in query or "2 weeks" in query:
-            window_days = 14
-        elif "today" in query:
-            window_days = 1
+        # Extract time window if specified (one scan; longest window wins)
+        found = {match.lastgroup for match in _WINDOW_RE.finditer(query)}
+        window_days = next((days for group, days in _WINDOW_DAYS if group in found), 7)
 
         velocity = self.temporal_analyzer.compute_velocity(window_days=window_days)
         drift_warnings = self.temporal_analyzer.detect_velocity_drift()
@@ -126,7 +216,8 @@ class AgenticQueryEngine:
             success=True,
             query_type="velocity",
             data={
-                "metrics": velocity.model_dump(),
+                # Zero counts are meaningful, but unset averages are just noise
+                "metrics": asdict(velocity, dict_factory=_dict_without_none),
                 "window_days": window_days,
                 "drift_warnings": drift_warnings,
             },
@@ -143,7 +234,7 @@ class AgenticQueryEngine:
                 id=b.id,
                 insight_type="bottleneck",
                 description=f"{b.description}: {b.block_reason}" if b.block_reason else b.description or "Unknown",
-                impact_score=0.8 if b.severity.value in ("critical", "high") else 0.5,
+                impact_score=0.8 if b.severity in _HIGH_SEVERITY else 0.5,
                 confidence=0.9,
                 related_features=[b.feature_id]
             ))
@@ -153,7 +244,7 @@ class AgenticQueryEngine:
             query_type="bottlenecks",
             data={
                 "count": len(bottlenecks),
-                "bottlenecks": [b.model_dump() for b in bottlenecks],
+                "bottlenecks": bottlenecks[:self.MAX_BOTTLENECKS],
             },
             insights=insights
         )
@@ -168,12 +259,16 @@ class AgenticQueryEngine:
             return AnalyticsQueryResponse(
                 success=True,
                 query_type="profile",
-                data={"profile": profile.model_dump()},
+                data={"profile": profile},
             )
         else:
             # List all agents
             agents = self.agent_profiler.list_agents()
-            profiles = [self.agent_profiler.build_profile(a).model_dump() for a in agents[:5]]
+            # Profiles are independent reads; build them on separate pooled sessions
+            profiles = []
+            if agents:
+                with ThreadPoolExecutor(max_workers=min(len(agents), 5)) as pool:
+                    profiles = list(pool.map(self.agent_profiler.build_profile, agents[:5]))
 
             return AnalyticsQueryResponse(
                 success=True,
@@ -193,8 +288,8 @@ class AgenticQueryEngine:
             success=True,
             query_type="patterns",
             data={
-                "clusters": [c.model_dump() for c in clusters],
-                "workflows": [w.model_dump() for w in workflows[:10]],
+                "clusters": clusters,
+                "workflows": workflows[:10],
             },
         )
 
@@ -212,15 +307,14 @@ class AgenticQueryEngine:
 
     def _extract_agent(self, query: str) -> Optional[str]:
         """Try to extract agent name from query."""
-        # Common agent names
-        known_agents = ["claude-code", "claude", "codex", "gemini", "cursor"]
-
-        for agent in known_agents:
-            if agent in query.lower():
+        # One scan for every known name; earlier names in _KNOWN_AGENTS win
+        found = set(_AGENT_RE.findall(query.lower()))
+        for agent in _KNOWN_AGENTS:
+            if agent in found:
                 return agent
 
         # Check for "my" which implies current user/agent
-        if " my " in f" {query} " or query.startswith("my "):
+        if _MY_RE.search(query):
             return "claude-code"  # Default agent
 
         return None
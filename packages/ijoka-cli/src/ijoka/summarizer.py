@@ -6,9 +6,16 @@ via the Claude CLI in headless mode. This uses the same authentication
 as the user's Claude Code installation.
 """
 
+import hashlib
 import json
+import os
+import re
 import subprocess
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from io import StringIO
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -45,6 +52,15 @@ class SummaryRequest(BaseModel):
 # SUMMARIZER
 # =============================================================================
 
+# Markdown fence lines (```json, ```) wrapped around a JSON response
+_FENCE_RE = re.compile(r"^```.*\n?", re.MULTILINE)
+
+
+def _default_cache_dir() -> Path:
+    """Summary cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ijoka" / "summaries"
+
 
 @dataclass
 class ClaudeHeadlessConfig:
@@ -53,6 +69,7 @@ class ClaudeHeadlessConfig:
     max_tokens: int = 1024
     timeout_seconds: int = 60
     tools: str = ""  # Empty string disables tools
+    cache_dir: Optional[Path] = field(default_factory=_default_cache_dir)  # None: memory only
 
 
 class TranscriptSummarizer:
@@ -87,16 +104,46 @@ Focus on:
 
 Return ONLY valid JSON, no markdown code blocks or explanations.'''
 
+    BATCH_SUMMARY_PROMPT = '''Analyze each Claude Code session transcript below and generate a structured summary for each one.
+
+{transcripts}
+
+Return a JSON array with exactly one object per transcript, in the same order, each with this exact structure:
+{{
+  "id": "the transcript id attribute",
+  "title": "Brief title for the session (5-10 words)",
+  "summary": "2-3 sentence summary of what was accomplished",
+  "key_actions": ["action 1", "action 2", ...],
+  "tools_highlighted": ["most used tool 1", "tool 2", ...],
+  "files_modified": ["file1.py", "file2.ts", ...],
+  "decisions_made": ["decision 1", "decision 2", ...]
+}}
+
+Focus on:
+- What the user was trying to accomplish
+- Key code changes or implementations
+- Important decisions or architectural choices
+- Files that were created or significantly modified
+
+Return ONLY a valid JSON array, no markdown code blocks or explanations.'''
+
+    # Summaries kept in memory, keyed by transcript content. Shared by all
+    # instances (callers build a summarizer per request); keys include the model
+    SUMMARY_CACHE_SIZE = 500
+    _summary_cache: OrderedDict[str, SessionSummary] = OrderedDict()
+    _summary_cache_lock = threading.Lock()
+
     def __init__(self, config: Optional[ClaudeHeadlessConfig] = None):
         """Initialize summarizer with optional config."""
         self.config = config or ClaudeHeadlessConfig()
 
-    def _run_claude_headless(self, prompt: str) -> dict:
+    def _run_claude_headless(self, prompt: str, timeout_seconds: Optional[int] = None) -> dict:
         """
         Run Claude CLI in headless mode and return parsed response.
 
         Args:
             prompt: The prompt to send to Claude
+            timeout_seconds: Override for the configured timeout
 
         Returns:
             Parsed JSON response from Claude
@@ -104,26 +151,32 @@ Return ONLY valid JSON, no markdown code blocks or explanations.'''
         Raises:
             RuntimeError: If Claude CLI fails or returns invalid JSON
         """
+        # The prompt goes over stdin: transcripts (and batches of them) can
+        # exceed the kernel's per-argument size limit
         cmd = [
             "claude",
-            "-p", prompt,
+            "-p",
             "--model", self.config.model,
             "--output-format", "json",
             "--tools", self.config.tools,  # Empty disables tools
             "--no-session-persistence",  # Don't save this as a session
         ]
+        timeout = timeout_seconds or self.config.timeout_seconds
 
         try:
+            # Keep output as bytes: json.loads decodes UTF-8 itself, so no
+            # intermediate str copy of the whole response is made
             result = subprocess.run(
                 cmd,
+                input=prompt.encode(),
                 capture_output=True,
-                text=True,
-                timeout=self.config.timeout_seconds,
+                timeout=timeout,
                 cwd=str(Path.home()),  # Run from home to avoid project context
             )
 
             if result.returncode != 0:
-                raise RuntimeError(f"Claude CLI failed: {result.stderr}")
+                stderr = result.stderr.decode(errors="replace")
+                raise RuntimeError(f"Claude CLI failed: {stderr}")
 
             # Parse the JSON output
             response = json.loads(result.stdout)
@@ -149,16 +202,12 @@ Return ONLY valid JSON, no markdown code blocks or explanations.'''
             text = text.strip()
             if text.startswith("```"):
                 # Remove markdown code blocks
-                lines = text.split("\n")
-                text = "\n".join(
-                    line for line in lines
-                    if not line.startswith("```")
-                )
+                text = _FENCE_RE.sub("", text)
 
             return json.loads(text)
 
         except subprocess.TimeoutExpired:
-            raise RuntimeError(f"Claude CLI timed out after {self.config.timeout_seconds}s")
+            raise RuntimeError(f"Claude CLI timed out after {timeout}s")
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse Claude response as JSON: {e}")
         except FileNotFoundError:
@@ -181,32 +230,46 @@ Return ONLY valid JSON, no markdown code blocks or explanations.'''
         Returns:
             Formatted transcript text
         """
-        lines = []
+        # Write straight into one buffer instead of building per-entry strings
+        buf = StringIO()
+        write = buf.write
+        sep = ""
 
-        for entry in entries[:max_entries]:
+        for entry in islice(entries, max_entries):
             entry_type = entry.get("entry_type", "unknown")
             content = entry.get("content", "")
 
             if entry_type == "user":
+                write(sep)
+                write("USER: ")
                 # Truncate long user messages
+                write(content[:500])
                 if len(content) > 500:
-                    content = content[:500] + "..."
-                lines.append(f"USER: {content}")
+                    write("...")
+                sep = "\n\n"
 
             elif entry_type == "assistant":
                 model = entry.get("model", "")
                 tool_count = entry.get("tool_call_count", 0)
 
+                write(sep)
+                write("ASSISTANT")
+                if model:
+                    write(" [")
+                    write(model)
+                    write("]")
+                if tool_count:
+                    write(" (used ")
+                    write(str(tool_count))
+                    write(" tools)")
+                write(": ")
                 # Truncate long assistant responses
+                write(content[:1000])
                 if len(content) > 1000:
-                    content = content[:1000] + "..."
-
-                model_str = f" [{model}]" if model else ""
-                tools_str = f" (used {tool_count} tools)" if tool_count else ""
+                    write("...")
+                sep = "\n\n"
 
-                lines.append(f"ASSISTANT{model_str}{tools_str}: {content}")
-
-        return "\n\n".join(lines)
+        return buf.getvalue()
 
     def summarize_from_entries(
         self,
@@ -241,31 +304,172 @@ Return ONLY valid JSON, no markdown code blocks or explanations.'''
                 tools_highlighted=[],
             )
 
+        # Transcript entries are immutable, so unchanged text means an unchanged summary
+        cache_key = self._cache_key(transcript_text)
+        cached = self._load_cached(session_id, cache_key)
+        if cached is not None:
+            return cached
+
         # Generate summary using Claude
         prompt = self.SUMMARY_PROMPT.format(transcript=transcript_text)
 
         try:
             result = self._run_claude_headless(prompt)
-
-            return SessionSummary(
-                session_id=session_id,
-                title=result.get("title", "Untitled Session"),
-                summary=result.get("summary", ""),
-                key_actions=result.get("key_actions", []),
-                tools_highlighted=result.get("tools_highlighted", []),
-                files_modified=result.get("files_modified", []),
-                decisions_made=result.get("decisions_made", []),
-                model=self.config.model,
-            )
+            summary = self._summary_from_result(session_id, result)
+            self._store_cached(cache_key, summary)
+            return summary
         except Exception as e:
             # Return error summary on failure
-            return SessionSummary(
-                session_id=session_id,
-                title="Summary Generation Failed",
-                summary=f"Error: {str(e)}",
-                key_actions=[],
-                tools_highlighted=[],
+            return self._failed_summary(session_id, e)
+
+    def summarize_batch(
+        self,
+        sessions: list[tuple[str, list[dict]]],
+        max_entries: int = 100,
+        include_tool_details: bool = False
+    ) -> list[SessionSummary]:
+        """
+        Generate summaries for several sessions with one Claude CLI call.
+
+        Amortizes CLI startup across sessions (e.g. for daily digests).
+
+        Args:
+            sessions: (session_id, transcript entries) pairs
+            max_entries: Maximum entries to include per session
+            include_tool_details: Whether to include tool details
+
+        Returns:
+            One SessionSummary per session, in input order
+        """
+        summaries: dict[str, SessionSummary] = {}
+        cache_keys: dict[str, str] = {}
+        parts = []
+        for session_id, entries in sessions:
+            transcript_text = self._prepare_transcript_text(
+                entries, max_entries, include_tool_details
             )
+            if not transcript_text.strip():
+                summaries[session_id] = self.summarize_from_entries(session_id, [])
+                continue
+            cache_keys[session_id] = cache_key = self._cache_key(transcript_text)
+            cached = self._load_cached(session_id, cache_key)
+            if cached is not None:
+                summaries[session_id] = cached
+            else:
+                parts.append(f'<transcript id="{session_id}">\n{transcript_text}\n</transcript>')
+
+        pending = [session_id for session_id, _ in sessions if session_id not in summaries]
+        if pending:
+            prompt = self.BATCH_SUMMARY_PROMPT.format(transcripts="\n\n".join(parts))
+            try:
+                # Allow each transcript the time a single summary would get
+                results = self._run_claude_headless(
+                    prompt, timeout_seconds=self.config.timeout_seconds * len(pending)
+                )
+                if not isinstance(results, list):
+                    raise RuntimeError(f"Expected a list of {len(pending)} summaries")
+                results = [result for result in results if isinstance(result, dict)]
+                by_id = {
+                    str(result["id"]): result for result in results
+                    if result.get("id") is not None
+                }
+                if not by_id and len(results) == len(pending):
+                    # No ids to check: trust the order, but don't cache a
+                    # pairing that may be wrong
+                    for session_id, result in zip(pending, results):
+                        summaries[session_id] = self._summary_from_result(session_id, result)
+                else:
+                    for session_id in pending:
+                        result = by_id.get(session_id)
+                        if result is None:
+                            summaries[session_id] = self._failed_summary(
+                                session_id, RuntimeError("No summary returned for this session")
+                            )
+                            continue
+                        summary = self._summary_from_result(session_id, result)
+                        self._store_cached(cache_keys[session_id], summary)
+                        summaries[session_id] = summary
+            except Exception as e:
+                for session_id in pending:
+                    summaries[session_id] = self._failed_summary(session_id, e)
+
+        return [summaries[session_id] for session_id, _ in sessions]
+
+    def _summary_from_result(self, session_id: str, result: dict) -> SessionSummary:
+        """Build a SessionSummary from a parsed Claude response object."""
+        return SessionSummary(
+            session_id=session_id,
+            title=result.get("title", "Untitled Session"),
+            summary=result.get("summary", ""),
+            key_actions=result.get("key_actions", []),
+            tools_highlighted=result.get("tools_highlighted", []),
+            files_modified=result.get("files_modified", []),
+            decisions_made=result.get("decisions_made", []),
+            model=self.config.model,
+        )
+
+    def _failed_summary(self, session_id: str, error: Exception) -> SessionSummary:
+        """Build the placeholder summary returned when generation fails."""
+        return SessionSummary(
+            session_id=session_id,
+            title="Summary Generation Failed",
+            summary=f"Error: {str(error)}",
+            key_actions=[],
+            tools_highlighted=[],
+        )
+
+    def _cache_key(self, transcript_text: str) -> str:
+        """Cache key for a summary: a hash of the model and the exact text sent to Claude."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{self.config.model}|".encode())
+        digest.update(transcript_text.encode())
+        return digest.hexdigest()
+
+    def _load_cached(self, session_id: str, key: str) -> Optional[SessionSummary]:
+        """
+        Look a summary up in memory, then on disk.
+
+        Identical transcripts share a summary, so hits are re-labelled with
+        the requested session ID. Unreadable cache files count as misses.
+        """
+        with self._summary_cache_lock:
+            summary = self._summary_cache.get(key)
+            if summary is not None:
+                self._summary_cache.move_to_end(key)
+
+        if summary is None and self.config.cache_dir is not None:
+            try:
+                path = self.config.cache_dir / f"{key}.json"
+                summary = SessionSummary.model_validate_json(path.read_bytes())
+            except (OSError, ValueError):
+                return None
+            self._remember(key, summary)
+
+        if summary is None or summary.session_id == session_id:
+            return summary
+        return summary.model_copy(update={"session_id": session_id})
+
+    def _store_cached(self, key: str, summary: SessionSummary) -> None:
+        """Cache a summary in memory and on disk; disk failures only cost a future re-run."""
+        self._remember(key, summary)
+        if self.config.cache_dir is None:
+            return
+        try:
+            path = self.config.cache_dir / f"{key}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(summary.model_dump_json())
+            tmp.replace(path)
+        except OSError:
+            pass
+
+    def _remember(self, key: str, summary: SessionSummary) -> None:
+        """Add a summary to the bounded in-memory cache."""
+        with self._summary_cache_lock:
+            self._summary_cache[key] = summary
+            self._summary_cache.move_to_end(key)
+            while len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
 
     def summarize_session(self, session_id: str, project_path: Optional[str] = None) -> SessionSummary:
         """
@@ -8,22 +8,35 @@ Parses JSONL transcript files from ~/.claude/projects/ to extract:
 - Token usage statistics
 """
 
+import functools
 import json
 import os
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Iterator, Any
 
+from loguru import logger
 from pydantic import BaseModel, Field
 
+try:
+    # Optional: several times faster than the stdlib on transcript lines
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # =============================================================================
 # TRANSCRIPT MODELS
 # =============================================================================
 
 
-class TokenUsage(BaseModel):
+@dataclass(slots=True)
+class TokenUsage:
     """Token usage statistics from a single API call."""
     input_tokens: int = 0
     output_tokens: int = 0
@@ -35,14 +48,16 @@ class TokenUsage(BaseModel):
         return self.input_tokens + self.output_tokens
 
 
-class ToolCall(BaseModel):
+@dataclass(slots=True)
+class ToolCall:
     """A tool invocation from an assistant message."""
     id: str
     name: str
-    input: dict = Field(default_factory=dict)
+    input: dict = field(default_factory=dict)
 
 
-class ToolResult(BaseModel):
+@dataclass(slots=True)
+class ToolResult:
     """Result of a tool invocation."""
     tool_use_id: str
     content: str = ""
@@ -117,6 +132,54 @@ class TranscriptSummary(BaseModel):
 # =============================================================================
 
 
+def _session_info(session_id: str, file_path: str, stat: os.stat_result) -> dict:
+    """Build a list_sessions() entry."""
+    return {
+        "session_id": session_id,
+        "file_path": file_path,
+        "size_bytes": stat.st_size,
+        "modified_at": datetime.fromtimestamp(stat.st_mtime),
+    }
+
+
+# Assistant usage counters, in TokenUsage field order
+_USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    """Return a string-or-None field, raising TypeError for anything else."""
+    if value is not None and not isinstance(value, str):
+        raise TypeError(f"expected a string, got {type(value).__name__}")
+    return value
+
+
+def _read_transcript(file_path: str) -> bytes:
+    """Read a whole transcript, raising FileNotFoundError with a clear message."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Transcript not found: {file_path}") from None
+
+
+def _scan_jsonl(directory) -> Iterator[os.DirEntry]:
+    """
+    Yield the ``*.jsonl`` entries of a directory.
+
+    scandir entries carry the file type from readdir and cache their stat
+    result, so listing costs at most one stat per transcript.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".jsonl"):
+                yield entry
+
+
 class TranscriptParser:
     """
     Parser for Claude Code transcript JSONL files.
@@ -127,6 +190,10 @@ class TranscriptParser:
 
     CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 
+    # Per-process transcript counts by project dir: path -> (dir mtime_ns, count).
+    # Adding, removing or renaming a transcript bumps its directory's mtime.
+    _session_counts: dict[str, tuple[int, int]] = {}
+
     def __init__(self, project_path: Optional[str] = None):
         """
         Initialize parser for a specific project.
@@ -137,7 +204,8 @@ class TranscriptParser:
         """
         self.project_path = project_path or os.getcwd()
         self._encoded_path = self._encode_project_path(self.project_path)
-        self._transcript_dir = self.CLAUDE_PROJECTS_DIR / self._encoded_path
+        # Plain strings: transcript paths are only joined, stat'ed and opened
+        self._transcript_dir = os.path.join(self.CLAUDE_PROJECTS_DIR, self._encoded_path)
 
     @staticmethod
     def _encode_project_path(path: str) -> str:
@@ -159,8 +227,8 @@ class TranscriptParser:
 
         -Users-shakes-DevProjects-ijoka -> /Users/shakes/DevProjects/ijoka
         """
-        if encoded.startswith("-"):
-            return encoded.replace("-", "/", 1).replace("-", "/")
+        # The leading "-" is the root "/", so every dash maps back in one pass
+        # (dashes that were part of directory names are not recoverable)
         return encoded.replace("-", "/")
 
     def list_sessions(self) -> list[dict]:
@@ -172,23 +240,25 @@ class TranscriptParser:
         """
         sessions = []
 
-        if not self._transcript_dir.exists():
+        if not os.path.isdir(self._transcript_dir):
             return sessions
 
-        for jsonl_file in self._transcript_dir.glob("*.jsonl"):
-            session_id = jsonl_file.stem
-            stat = jsonl_file.stat()
-            sessions.append({
-                "session_id": session_id,
-                "file_path": str(jsonl_file),
-                "size_bytes": stat.st_size,
-                "modified_at": datetime.fromtimestamp(stat.st_mtime),
-            })
+        for jsonl_file in _scan_jsonl(self._transcript_dir):
+            sessions.append(_session_info(jsonl_file.name[:-6], jsonl_file.path, jsonl_file.stat()))
 
         # Sort by modified time, newest first
         sessions.sort(key=lambda x: x["modified_at"], reverse=True)
         return sessions
 
+    def _get_session_info(self, session_id: str) -> Optional[dict]:
+        """Session info for one transcript (as in list_sessions), from a single stat."""
+        file_path = os.path.join(self._transcript_dir, f"{session_id}.jsonl")
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return _session_info(session_id, file_path, stat)
+
     @classmethod
     def list_all_projects(cls) -> list[dict]:
         """
@@ -202,18 +272,30 @@ class TranscriptParser:
         if not cls.CLAUDE_PROJECTS_DIR.exists():
             return projects
 
-        for project_dir in cls.CLAUDE_PROJECTS_DIR.iterdir():
-            if project_dir.is_dir():
-                session_count = len(list(project_dir.glob("*.jsonl")))
-                if session_count > 0:
-                    projects.append({
-                        "project_path": cls._decode_project_path(project_dir.name),
-                        "encoded_path": project_dir.name,
-                        "session_count": session_count,
-                    })
+        with os.scandir(cls.CLAUDE_PROJECTS_DIR) as it:
+            for project_dir in it:
+                if project_dir.is_dir():
+                    session_count = cls._count_sessions(project_dir)
+                    if session_count > 0:
+                        projects.append({
+                            "project_path": cls._decode_project_path(project_dir.name),
+                            "encoded_path": project_dir.name,
+                            "session_count": session_count,
+                        })
 
         return projects
 
+    @classmethod
+    def _count_sessions(cls, project_dir: os.DirEntry) -> int:
+        """Number of transcripts in a project dir, rescanned only when its mtime changes."""
+        mtime_ns = project_dir.stat().st_mtime_ns
+        cached = cls._session_counts.get(project_dir.path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        count = sum(1 for _ in _scan_jsonl(project_dir.path))
+        cls._session_counts[project_dir.path] = (mtime_ns, count)
+        return count
+
     def parse_session(self, session_id: str) -> Iterator[TranscriptEntry]:
         """
         Parse a transcript session, yielding entries.
@@ -224,31 +306,36 @@ class TranscriptParser:
         Yields:
             TranscriptEntry objects for each line
         """
-        file_path = self._transcript_dir / f"{session_id}.jsonl"
+        file_path = os.path.join(self._transcript_dir, f"{session_id}.jsonl")
+        raw = _read_transcript(file_path)
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Transcript not found: {file_path}")
-
-        with open(file_path, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+        # One read and one C-level split (which also drops "\r\n" endings);
+        # both decoders take UTF-8 bytes directly
+        skipped = 0
+        for line in raw.splitlines():
+            if not line or line.isspace():
+                continue
 
-                try:
-                    data = json.loads(line)
-                    entry = self._parse_entry(data)
-                    if entry:
-                        yield entry
-                except json.JSONDecodeError as e:
-                    # Log but continue - some lines may be malformed
-                    continue
-                except Exception as e:
-                    # Log but continue
-                    continue
+            try:
+                entry = self._parse_entry(_json_loads(line))
+            except (ValueError, AttributeError, TypeError):
+                # Malformed JSON (both decoders' JSONDecodeError), rejected
+                # fields (pydantic's ValidationError) or an unexpected shape
+                skipped += 1
+                continue
+            if entry:
+                yield entry
+
+        if skipped:
+            logger.debug(f"Skipped {skipped} malformed lines in {file_path}")
 
     def _parse_entry(self, data: dict) -> Optional[TranscriptEntry]:
-        """Parse a single JSON entry into a TranscriptEntry."""
+        """
+        Parse a single JSON entry into a TranscriptEntry.
+
+        Fields, including nested tool calls/results and token usage, are
+        gathered as plain data and validated in one pydantic-core pass.
+        """
         entry_type = data.get("type")
 
         if entry_type == "queue-operation":
@@ -264,32 +351,31 @@ class TranscriptParser:
 
         message = data.get("message", {})
 
-        entry = TranscriptEntry(
-            type=entry_type,
-            session_id=data.get("sessionId", ""),
-            timestamp=self._parse_timestamp(data.get("timestamp")),
-            uuid=data.get("uuid"),
-            parent_uuid=data.get("parentUuid"),
-            cwd=data.get("cwd"),
-            git_branch=data.get("gitBranch"),
-            version=data.get("version"),
-            user_type=data.get("userType"),
-            is_sidechain=data.get("isSidechain", False),
-        )
-
         if entry_type == "user":
-            self._parse_user_message(entry, message)
-        elif entry_type == "assistant":
-            self._parse_assistant_message(entry, message)
-
-        return entry
-
-    def _parse_user_message(self, entry: TranscriptEntry, message: dict):
-        """Extract user message content."""
+            fields = self._parse_user_message(message)
+        else:
+            fields = self._parse_assistant_message(message)
+
+        fields["type"] = entry_type
+        fields["session_id"] = data.get("sessionId", "")
+        fields["timestamp"] = self._parse_timestamp(data.get("timestamp"))
+        fields["uuid"] = data.get("uuid")
+        fields["parent_uuid"] = data.get("parentUuid")
+        fields["cwd"] = data.get("cwd")
+        fields["git_branch"] = data.get("gitBranch")
+        fields["version"] = data.get("version")
+        fields["user_type"] = data.get("userType")
+        fields["is_sidechain"] = data.get("isSidechain", False)
+
+        return TranscriptEntry.model_validate(fields)
+
+    def _parse_user_message(self, message: dict) -> dict:
+        """Extract user message content as TranscriptEntry fields."""
+        fields = {}
         content = message.get("content")
 
         if isinstance(content, str):
-            entry.user_content = content
+            fields["user_content"] = content
         elif isinstance(content, list):
             # Content can be a list of blocks
             text_parts = []
@@ -301,32 +387,39 @@ class TranscriptParser:
                 elif isinstance(block, dict):
                     block_type = block.get("type")
                     if block_type == "text":
-                        text_parts.append(block.get("text", ""))
+                        # Empty blocks would only add blank lines to the join
+                        text = block.get("text")
+                        if text:
+                            text_parts.append(text)
                     elif block_type == "tool_result":
-                        tool_results.append(ToolResult(
-                            tool_use_id=block.get("tool_use_id", ""),
-                            content=block.get("content", ""),
-                            is_error=block.get("is_error", False),
-                        ))
+                        tool_results.append({
+                            "tool_use_id": block.get("tool_use_id", ""),
+                            "content": block.get("content", ""),
+                            "is_error": block.get("is_error", False),
+                        })
 
             if text_parts:
-                entry.user_content = "\n".join(text_parts)
-            entry.tool_results = tool_results
+                fields["user_content"] = "\n".join(text_parts)
+            fields["tool_results"] = tool_results
 
-    def _parse_assistant_message(self, entry: TranscriptEntry, message: dict):
-        """Extract assistant message content, tool calls, and token usage."""
-        entry.model = message.get("model")
-        entry.stop_reason = message.get("stop_reason")
+        return fields
+
+    def _parse_assistant_message(self, message: dict) -> dict:
+        """Extract assistant message content, tool calls, and token usage as TranscriptEntry fields."""
+        fields = {
+            "model": message.get("model"),
+            "stop_reason": message.get("stop_reason"),
+        }
 
         # Parse token usage
         usage = message.get("usage")
         if usage:
-            entry.token_usage = TokenUsage(
-                input_tokens=usage.get("input_tokens", 0),
-                output_tokens=usage.get("output_tokens", 0),
-                cache_creation_input_tokens=usage.get("cache_creation_input_tokens", 0),
-                cache_read_input_tokens=usage.get("cache_read_input_tokens", 0),
-            )
+            fields["token_usage"] = {
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+                "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
+                "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+            }
 
         # Parse content blocks
         content = message.get("content", [])
@@ -338,18 +431,22 @@ class TranscriptParser:
                 if isinstance(block, dict):
                     block_type = block.get("type")
                     if block_type == "text":
-                        text_parts.append(block.get("text", ""))
+                        text = block.get("text")
+                        if text:
+                            text_parts.append(text)
                     elif block_type == "tool_use":
-                        tool_calls.append(ToolCall(
-                            id=block.get("id", ""),
-                            name=block.get("name", ""),
-                            input=block.get("input", {}),
-                        ))
+                        tool_calls.append({
+                            "id": block.get("id", ""),
+                            "name": block.get("name", ""),
+                            "input": block.get("input", {}),
+                        })
                     # Skip "thinking" blocks (encrypted)
 
             if text_parts:
-                entry.assistant_text = "\n".join(text_parts)
-            entry.tool_calls = tool_calls
+                fields["assistant_text"] = "\n".join(text_parts)
+            fields["tool_calls"] = tool_calls
+
+        return fields
 
     @staticmethod
     def _parse_timestamp(ts: Any) -> datetime:
@@ -359,9 +456,9 @@ class TranscriptParser:
         if isinstance(ts, datetime):
             return ts
         if isinstance(ts, str):
-            # ISO format: 2025-12-13T10:27:57.894Z
+            # ISO format: 2025-12-13T10:27:57.894Z (fromisoformat takes "Z" on 3.11+)
             try:
-                return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                return datetime.fromisoformat(ts)
             except ValueError:
                 return datetime.now()
         return datetime.now()
@@ -370,12 +467,21 @@ class TranscriptParser:
         """
         Generate a summary of a transcript session.
 
+        Only the fields the summary needs are read and type-checked from
+        each decoded line; no TranscriptEntry is built, which is most of the
+        cost of parse_session. Lines are skipped when a field the summary
+        reads is malformed, so unlike parse_session, user lines whose tool
+        results carry list-valued content are still counted.
+
         Args:
             session_id: The session UUID
 
         Returns:
             TranscriptSummary with aggregated statistics
         """
+        file_path = os.path.join(self._transcript_dir, f"{session_id}.jsonl")
+        raw = _read_transcript(file_path)
+
         summary = TranscriptSummary(
             session_id=session_id,
             project_path=self.project_path,
@@ -383,44 +489,89 @@ class TranscriptParser:
 
         models_seen = set()
         branches_seen = set()
-        tools_count: dict[str, int] = {}
-        timestamps: list[datetime] = []
+        tools_count: Counter[str] = Counter()
+        start_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None
 
-        for entry in self.parse_session(session_id):
-            timestamps.append(entry.timestamp)
+        for line in raw.splitlines():
+            if not line or line.isspace():
+                continue
 
-            if entry.type == "user":
+            try:
+                data = _json_loads(line)
+                entry_type = data.get("type")
+                if entry_type not in ("user", "assistant", "queue-operation"):
+                    continue
+
+                # Pull out and type-check everything before counting, so a
+                # line the entry model would reject is skipped whole
+                model = usage = tool_names = git_branch = None
+                if entry_type != "queue-operation":
+                    message = data.get("message", {})
+                    content = message.get("content")
+                    git_branch = _optional_str(data.get("gitBranch"))
+                if entry_type == "assistant":
+                    model = _optional_str(message.get("model"))
+                    raw_usage = message.get("usage")
+                    if raw_usage:
+                        if not isinstance(raw_usage, dict):
+                            raise TypeError("usage is not an object")
+                        usage = [int(raw_usage.get(key, 0)) for key in _USAGE_FIELDS]
+                    if isinstance(content, list):
+                        tool_names = [
+                            block.get("name", "") for block in content
+                            if isinstance(block, dict) and block.get("type") == "tool_use"
+                        ]
+                        if not all(isinstance(name, str) for name in tool_names):
+                            raise TypeError("tool name is not a string")
+                timestamp = self._parse_timestamp(data.get("timestamp"))
+            except (ValueError, AttributeError, TypeError):
+                continue
+
+            # Running time range instead of collecting every timestamp
+            if start_time is None:
+                start_time = end_time = timestamp
+            elif timestamp < start_time:
+                start_time = timestamp
+            elif timestamp > end_time:
+                end_time = timestamp
+
+            if entry_type == "queue-operation":
+                continue
+
+            if entry_type == "user":
                 summary.user_message_count += 1
 
-            elif entry.type == "assistant":
+            else:
                 summary.assistant_message_count += 1
 
-                if entry.model:
-                    models_seen.add(entry.model)
+                if model:
+                    models_seen.add(model)
 
-                if entry.token_usage:
-                    summary.total_input_tokens += entry.token_usage.input_tokens
-                    summary.total_output_tokens += entry.token_usage.output_tokens
-                    summary.total_cache_creation_tokens += entry.token_usage.cache_creation_input_tokens
-                    summary.total_cache_read_tokens += entry.token_usage.cache_read_input_tokens
+                if usage:
+                    input_tokens, output_tokens, cache_creation, cache_read = usage
+                    summary.total_input_tokens += input_tokens
+                    summary.total_output_tokens += output_tokens
+                    summary.total_cache_creation_tokens += cache_creation
+                    summary.total_cache_read_tokens += cache_read
 
-                for tool_call in entry.tool_calls:
-                    summary.tool_call_count += 1
-                    tools_count[tool_call.name] = tools_count.get(tool_call.name, 0) + 1
+                if tool_names:
+                    summary.tool_call_count += len(tool_names)
+                    tools_count.update(tool_names)
 
-            if entry.git_branch:
-                branches_seen.add(entry.git_branch)
+            if git_branch:
+                branches_seen.add(git_branch)
 
         # Set time range
-        if timestamps:
-            summary.start_time = min(timestamps)
-            summary.end_time = max(timestamps)
+        if start_time is not None:
+            summary.start_time = start_time
+            summary.end_time = end_time
             duration = (summary.end_time - summary.start_time).total_seconds()
             summary.duration_minutes = round(duration / 60, 2)
 
         summary.models_used = sorted(models_seen)
         summary.git_branches = sorted(branches_seen)
-        summary.tools_used = dict(sorted(tools_count.items(), key=lambda x: -x[1]))
+        summary.tools_used = dict(tools_count.most_common())
 
         return summary
 
@@ -486,10 +637,33 @@ def get_session_cost_estimate(summary: TranscriptSummary) -> dict:
 # =============================================================================
 
 
+# Path: transcript.py -> ijoka -> src -> ijoka-cli -> packages -> claude-plugin/hooks/scripts
+_GRAPH_HELPER_PATH = str(Path(__file__).parent.parent.parent.parent / "claude-plugin" / "hooks" / "scripts")
+
+
+@functools.lru_cache(maxsize=1)
+def _graph_helper():
+    """
+    Import the plugin's graph_db_helper module once (None if unavailable).
+
+    Imported lazily to avoid circular deps and keep the driver off the
+    import path of commands that never sync.
+    """
+    if _GRAPH_HELPER_PATH not in sys.path:
+        sys.path.insert(0, _GRAPH_HELPER_PATH)
+    try:
+        import graph_db_helper
+    except ImportError:
+        return None
+    return graph_db_helper
+
+
 def sync_transcript_to_graph(
     parser: TranscriptParser,
     session_id: str,
-    clear_existing: bool = False
+    clear_existing: bool = False,
+    batch_size: int = 500,
+    session_info: Optional[dict] = None
 ) -> dict:
     """
     Sync a parsed transcript session to Memgraph.
@@ -501,98 +675,91 @@ def sync_transcript_to_graph(
         parser: TranscriptParser instance
         session_id: Session ID to sync
         clear_existing: If True, clear existing data before sync
+        batch_size: Entries written per graph round-trip
+        session_info: The session's list_sessions() entry, if already known
 
     Returns:
         Dict with sync statistics
     """
-    # Import graph helpers (lazy import to avoid circular deps)
-    import sys
-    # Path: transcript.py -> ijoka -> src -> ijoka-cli -> packages -> claude-plugin/hooks/scripts
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "claude-plugin" / "hooks" / "scripts"))
-    try:
-        from graph_db_helper import (
-            create_transcript_session,
-            insert_transcript_entry,
-            clear_transcript_session,
-            is_connected
-        )
-    except ImportError:
+    graph = _graph_helper()
+    if graph is None:
         return {"error": "graph_db_helper not available", "synced": 0}
 
-    if not is_connected():
+    if not graph.is_connected():
         return {"error": "Memgraph not connected", "synced": 0}
 
     # Get transcript file info
-    sessions = parser.list_sessions()
-    session_info = next((s for s in sessions if s["session_id"] == session_id), None)
+    if session_info is None:
+        session_info = parser._get_session_info(session_id)
     if not session_info:
         return {"error": f"Session {session_id} not found", "synced": 0}
 
     # Clear existing if requested
     if clear_existing:
-        clear_transcript_session(session_id)
+        graph.clear_transcript_session(session_id)
 
     # Create/update TranscriptSession node
-    create_transcript_session(
+    graph.create_transcript_session(
         session_id=session_id,
         project_dir=parser.project_path,
         transcript_path=session_info["file_path"],
         file_modified_at=session_info["modified_at"].isoformat()
     )
 
-    # Parse and insert entries
+    # Parse entries and insert them in batches
     entry_count = 0
     tool_count = 0
     errors = []
+    batch: list[dict] = []
 
-    for entry in parser.parse_session(session_id):
+    def flush() -> None:
+        nonlocal entry_count, tool_count
         try:
-            # Prepare tool calls list
-            tool_calls = None
-            if entry.tool_calls:
-                tool_calls = [
-                    {"id": tc.id, "name": tc.name, "input": tc.input}
-                    for tc in entry.tool_calls
-                ]
-                tool_count += len(tool_calls)
-
-            # Get content based on entry type
-            content = entry.user_content if entry.type == "user" else entry.assistant_text
-
-            # Get token usage
-            input_tokens = 0
-            output_tokens = 0
-            cache_creation_tokens = 0
-            cache_read_tokens = 0
-            if entry.token_usage:
-                input_tokens = entry.token_usage.input_tokens
-                output_tokens = entry.token_usage.output_tokens
-                cache_creation_tokens = entry.token_usage.cache_creation_input_tokens
-                cache_read_tokens = entry.token_usage.cache_read_input_tokens
-
-            insert_transcript_entry(
-                session_id=session_id,
-                entry_type=entry.type,
-                timestamp=entry.timestamp.isoformat(),
-                uuid=entry.uuid,
-                parent_uuid=entry.parent_uuid,
-                content=content,
-                model=entry.model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cache_creation_tokens=cache_creation_tokens,
-                cache_read_tokens=cache_read_tokens,
-                tool_calls=tool_calls,
-                stop_reason=entry.stop_reason,
-                is_sidechain=entry.is_sidechain
-            )
-            entry_count += 1
-
+            graph.insert_transcript_entries_batch(session_id, batch)
+            entry_count += len(batch)
+            tool_count += sum(len(row["tool_calls"] or ()) for row in batch)
         except Exception as e:
             errors.append(str(e))
+        batch.clear()
+
+    for entry in parser.parse_session(session_id):
+        # Prepare tool calls list
+        tool_calls = None
+        if entry.tool_calls:
+            tool_calls = [
+                {"id": tc.id, "name": tc.name, "input": tc.input}
+                for tc in entry.tool_calls
+            ]
+
+        # Get content based on entry type
+        content = entry.user_content if entry.type == "user" else entry.assistant_text
+
+        # Get token usage
+        usage = entry.token_usage or TokenUsage()
+
+        batch.append({
+            "entry_type": entry.type,
+            "timestamp": entry.timestamp.isoformat(),
+            "uuid": entry.uuid,
+            "parent_uuid": entry.parent_uuid,
+            "content": content,
+            "model": entry.model,
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_tokens": usage.cache_creation_input_tokens,
+            "cache_read_tokens": usage.cache_read_input_tokens,
+            "tool_calls": tool_calls,
+            "stop_reason": entry.stop_reason,
+            "is_sidechain": entry.is_sidechain,
+        })
+        if len(batch) >= batch_size:
+            flush()
             if len(errors) > 10:
                 break
 
+    if batch and len(errors) <= 10:
+        flush()
+
     return {
         "session_id": session_id,
         "entries_synced": entry_count,
@@ -605,15 +772,22 @@ def sync_transcript_to_graph(
 def sync_all_transcripts_to_graph(
     project_path: Optional[str] = None,
     limit: int = 100,
-    clear_existing: bool = False
+    clear_existing: bool = False,
+    batch_size: int = 500,
+    max_workers: int = 4
 ) -> dict:
     """
     Sync all transcript sessions to Memgraph.
 
+    Sessions are independent and I/O bound (file reads and graph
+    round-trips), so they sync concurrently on a thread pool.
+
     Args:
         project_path: Project directory (defaults to cwd)
         limit: Maximum sessions to sync
         clear_existing: If True, clear existing data before sync
+        batch_size: Entries written per graph round-trip
+        max_workers: Sessions synced at once
 
     Returns:
         Dict with overall sync statistics
@@ -630,13 +804,23 @@ def sync_all_transcripts_to_graph(
         "errors": []
     }
 
-    for session_info in sessions:
-        result = sync_transcript_to_graph(
+    def sync(session_info: dict) -> dict:
+        return sync_transcript_to_graph(
             parser=parser,
             session_id=session_info["session_id"],
-            clear_existing=clear_existing
+            clear_existing=clear_existing,
+            batch_size=batch_size,
+            session_info=session_info
         )
 
+    # The first session syncs on this thread so the shared graph driver is
+    # created once, before workers would race to initialize it
+    session_results = [sync(session) for session in sessions[:1]]
+    if len(sessions) > 1:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sessions) - 1))) as pool:
+            session_results.extend(pool.map(sync, sessions[1:]))
+
+    for session_info, result in zip(sessions, session_results):
         if result.get("success"):
             results["synced"] += 1
             results["total_entries"] += result.get("entries_synced", 0)